@@ -0,0 +1,11 @@
+"""
+Shared tooling for running, timing and comparing the daily solutions.
+
+Solver scripts stay where they are (``dayN/mainX.Y.py``). A script takes part
+in the tooling by defining top level ``part1(file_path)`` and/or
+``part2(file_path)`` functions that return the answer for the given input file.
+"""
+
+from aoc.registry import Variant, discover, find_variant, load_module
+
+__all__ = ["Variant", "discover", "find_variant", "load_module"]
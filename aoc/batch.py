@@ -0,0 +1,153 @@
+"""
+Solve many inputs of the same day in parallel.
+
+Inputs are sharded over one long-lived process pool; every worker imports the solver
+once and keeps it for all the inputs it is handed. Results stream to stdout as JSON
+lines in completion order.
+
+Usage:
+    python -m aoc.batch 10 inputs/                      # every *.txt in a directory
+    python -m aoc.batch 10 "inputs/day10_*.txt" --part 2 --workers 8
+"""
+import argparse
+import glob
+import json
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from dataclasses import asdict
+
+from aoc.cache import ResultCache, to_json
+from aoc.registry import discover, find_variant, normalize_day
+from aoc.runner import RunResult, parse_parts, run
+
+_worker_registry = None
+
+
+def _init_worker():
+    global _worker_registry
+    _worker_registry = discover()
+
+
+def _solve(day: str, part: str, variant_name: str, input_path: str) -> RunResult:
+    variant = find_variant(_worker_registry, day, part, variant_name)
+    return run(variant, part, input_path)
+
+
+def expand_inputs(specs: list[str]) -> list[str]:
+    """
+    Turn directories, glob patterns and plain paths into a sorted list of input files.
+    """
+    paths = []
+    for spec in specs:
+        if os.path.isdir(spec):
+            paths += glob.glob(os.path.join(spec, "*.txt"))
+        elif any(ch in spec for ch in "*?["):
+            paths += glob.glob(spec)
+        else:
+            paths.append(spec)
+    return sorted({os.path.abspath(p) for p in paths})
+
+
+def to_record(result: RunResult) -> dict:
+    record = {k: v for k, v in asdict(result).items() if k not in ("counters", "profile_report", "error")}
+    try:
+        record["answer"] = to_json(result.answer)
+    except TypeError:
+        record["answer"] = str(result.answer)
+    if result.error is not None:
+        record["error"] = result.error
+    return record
+
+
+def solve_batch(day, input_paths: list[str], parts: list[str], variant_name: str = None,
+                workers: int = None, cache: ResultCache = None):
+    """
+    Return an iterator that yields a RunResult per (input, part) as soon as it is ready.
+
+    Variants are looked up before anything runs, so an unknown day, part or variant
+    raises ``KeyError`` here rather than while iterating. An input whose solver raises
+    yields a result with ``error`` set and the batch goes on with the other inputs.
+
+    Args:
+        day: Day number or folder name.
+        input_paths (list): Input files.
+        parts (list): Entry points to run, e.g. ``["part1", "part2"]``.
+        variant_name (str): Variant label, default is the newest one per part.
+        workers (int): Pool size, default is one per CPU.
+        cache (ResultCache): Answers found here are yielded without touching the pool.
+    """
+    day = normalize_day(day)
+    registry = discover()
+    variants = {part: find_variant(registry, day, part, variant_name) for part in parts}
+    return _stream(day, variants, input_paths, workers, cache)
+
+
+def _stream(day: str, variants: dict, input_paths: list[str], workers: int, cache: ResultCache):
+    use_cache = cache is not None and cache.enabled
+    pending = []
+    for input_path in input_paths:
+        for part, variant in variants.items():
+            if use_cache:
+                try:
+                    hit, answer = cache.get(cache.key(variant, part, input_path))
+                except OSError as e:  # the key hashes the input, so a missing file fails here
+                    yield RunResult(day, variant.name, part, input_path, None, 0.0, None,
+                                    error=f"{type(e).__name__}: {e}")
+                    continue
+                if hit:
+                    yield RunResult(day, variant.name, part, input_path, answer, 0.0, None, cached=True)
+                    continue
+            pending.append((part, variant, input_path))
+    if not pending:
+        return
+
+    workers = min(workers or os.cpu_count() or 1, len(pending))
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker) as pool:
+        futures = {pool.submit(_solve, day, part, variant.name, input_path): (part, variant, input_path)
+                   for part, variant, input_path in pending}
+        for future in as_completed(futures):
+            part, variant, input_path = futures[future]
+            try:
+                result = future.result()
+            except Exception as e:
+                yield RunResult(day, variant.name, part, input_path, None, 0.0, None,
+                                error=f"{type(e).__name__}: {e}")
+                continue
+            if use_cache:
+                cache.put(cache.key(variant, part, input_path), result.answer, seconds=result.seconds)
+            yield result
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Solve many inputs of one day in parallel.")
+    parser.add_argument("day", help="day number or folder name")
+    parser.add_argument("inputs", nargs="+", help="input files, directories or glob patterns")
+    parser.add_argument("--part", help="1 or 2 (default: both)")
+    parser.add_argument("--variant", help="variant label (default: newest)")
+    parser.add_argument("--workers", type=int, help="worker processes (default: one per CPU)")
+    parser.add_argument("--no-cache", action="store_true", help="always solve, ignore and do not fill the answer cache")
+    args = parser.parse_args(argv)
+
+    input_paths = expand_inputs(args.inputs)
+    if not input_paths:
+        print("No input files found", file=sys.stderr)
+        return 1
+    cache = ResultCache(enabled=not args.no_cache)
+    try:
+        results = solve_batch(args.day, input_paths, parse_parts(args.part), args.variant, args.workers, cache)
+    except KeyError as e:
+        print(e.args[0], file=sys.stderr)
+        return 1
+    failed = 0
+    for result in results:
+        failed += result.error is not None
+        print(json.dumps(to_record(result)), flush=True)
+    if failed:
+        print(f"{failed} run(s) failed", file=sys.stderr)
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,196 @@
+"""
+Benchmark every registered variant of a day against each other.
+
+Usage:
+    python -m aoc.bench 10                          # all variants, input.txt + input2.txt
+    python -m aoc.bench 7 --part 1 --repeat 10
+    python -m aoc.bench 7 --input big.txt --save baseline.json
+    python -m aoc.bench 10 --scale 10 --scale 100         # add synthetic inputs (see aoc.generators)
+    python -m aoc.bench 7 --compare baseline.json   # flag regressions against a saved run
+    python -m aoc.bench 3 --scale 100 --scale 1000  # MB/s column shows throughput on big inputs
+"""
+import argparse
+import json
+import os
+import statistics
+import sys
+import tracemalloc
+from dataclasses import asdict, dataclass
+from time import perf_counter
+
+from aoc.generators import write_input
+from aoc.registry import Variant, discover, get_solver, normalize_day
+from aoc.runner import parse_parts
+
+DEFAULT_INPUTS = ("input.txt", "input2.txt")
+REGRESSION_THRESHOLD = 1.2
+REGRESSION_MIN_SECONDS = 0.001  # ignore timer noise on very fast runs
+
+
+@dataclass
+class BenchResult:
+    day: str
+    variant: str
+    part: str
+    input_name: str
+    answer: object
+    median: float
+    p95: float
+    peak_mb: float
+    mb_per_s: float = 0.0
+    agrees: bool = True
+    error: str = None
+
+
+def percentile(samples: list[float], q: int) -> float:
+    """
+    q-th percentile of the samples (nearest-rank is fine for a handful of repeats).
+    """
+    ordered = sorted(samples)
+    index = max(0, min(len(ordered) - 1, round(q / 100 * len(ordered) + 0.5) - 1))
+    return ordered[index]
+
+
+def measure(solver, file_path: str, repeat: int) -> tuple:
+    """
+    Time a solver ``repeat`` times, then run it once more under tracemalloc for peak memory.
+    Memory is measured separately so tracing overhead never ends up in the timings.
+
+    Returns:
+        tuple: (answer, list of timings in seconds, peak traced memory in MB)
+    """
+    timings = []
+    answer = None
+    for _ in range(repeat):
+        start = perf_counter()
+        answer = solver(file_path)
+        timings.append(perf_counter() - start)
+
+    tracemalloc.start()
+    try:
+        solver(file_path)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return answer, timings, peak / (1024 * 1024)
+
+
+def resolve_inputs(day_dir: str, inputs: list[str] | None) -> list[str]:
+    if inputs:
+        return [p if os.path.isabs(p) or os.path.exists(p) else os.path.join(day_dir, p) for p in inputs]
+    return [os.path.join(day_dir, name) for name in DEFAULT_INPUTS if os.path.exists(os.path.join(day_dir, name))]
+
+
+def benchmark(variants: list[Variant], part: str, input_paths: list[str], repeat: int = 5) -> list[BenchResult]:
+    """
+    Run every variant providing ``part`` on every input and check that their answers agree.
+
+    Args:
+        variants (list): Variants of one day.
+        part (str): ``part1`` or ``part2``.
+        input_paths (list): Input files to run on.
+        repeat (int): Timed runs per variant and input.
+
+    Returns:
+        list: One BenchResult per (variant, input). ``agrees`` is False for answers
+              that differ from the majority answer on that input, and for variants that
+              raised (their ``error`` holds the exception).
+    """
+    results = []
+    for file_path in input_paths:
+        size_mb = os.path.getsize(file_path) / (1024 * 1024)
+        per_input = []
+        for variant in variants:
+            if part not in variant.parts:
+                continue
+            try:
+                answer, timings, peak_mb = measure(get_solver(variant, part), file_path, repeat)
+            except Exception as e:
+                per_input.append(BenchResult(variant.day, variant.name, part, os.path.basename(file_path), None,
+                                             0.0, 0.0, 0.0, agrees=False, error=f"{type(e).__name__}: {e}"))
+                continue
+            median = statistics.median(timings)
+            per_input.append(BenchResult(variant.day, variant.name, part, os.path.basename(file_path), answer,
+                                         median, percentile(timings, 95), peak_mb, size_mb / (median or 1e-12)))
+
+        solved = [r for r in per_input if r.error is None]
+        answers = [repr(r.answer) for r in solved]
+        if answers:
+            majority = max(set(answers), key=answers.count)
+            for r, a in zip(solved, answers):
+                r.agrees = a == majority
+        results.extend(per_input)
+    return results
+
+
+def format_table(results: list[BenchResult], baseline: dict | None = None) -> str:
+    lines = [f"{'input':>18} {'variant':>8} {'part':>5} {'median':>10} {'p95':>10} {'peak MB':>9} {'MB/s':>8} {'x best':>7}  answer"]
+    by_input = {}
+    for r in results:
+        by_input.setdefault((r.part, r.input_name), []).append(r)
+    for (_, input_name), group in by_input.items():
+        best = min((r.median for r in group if r.error is None), default=0.0) or 1e-12
+        for r in sorted(group, key=lambda r: (r.error is not None, r.median)):
+            if r.error is not None:
+                lines.append(f"{input_name:>18} {r.variant:>8} {r.part[-1]:>5} {'-':>10} {'-':>10} "
+                             f"{'-':>9} {'-':>8} {'-':>7}  FAILED ({r.error})")
+                continue
+            flags = "" if r.agrees else "  MISMATCH"
+            if baseline is not None:
+                old = baseline.get(result_key(r))
+                if (old is not None and old.get("error") is None and r.median > old["median"] * REGRESSION_THRESHOLD
+                        and r.median - old["median"] > REGRESSION_MIN_SECONDS):
+                    flags += f"  REGRESSION ({old['median']:.4f}s before)"
+            lines.append(f"{input_name:>18} {r.variant:>8} {r.part[-1]:>5} {r.median:9.4f}s {r.p95:9.4f}s "
+                         f"{r.peak_mb:9.2f} {r.mb_per_s:8.1f} {r.median / best:7.1f}  {r.answer}{flags}")
+    return "\n".join(lines)
+
+
+def result_key(r: BenchResult) -> str:
+    return f"{r.day}/{r.variant}/{r.part}/{r.input_name}"
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Compare all registered variants of a day.")
+    parser.add_argument("day", help="day number or folder name")
+    parser.add_argument("--part", help="1 or 2 (default: both)")
+    parser.add_argument("--input", action="append", help="input file (repeatable, default: input.txt and input2.txt)")
+    parser.add_argument("--scale", type=float, action="append", default=[],
+                        help="also run on a generated input of this size multiplier (repeatable)")
+    parser.add_argument("--seed", type=int, default=0, help="seed for generated inputs")
+    parser.add_argument("--repeat", type=int, default=5, help="timed runs per variant and input")
+    parser.add_argument("--save", help="write results to a JSON baseline")
+    parser.add_argument("--compare", help="flag variants more than 20%% slower than this JSON baseline")
+    args = parser.parse_args(argv)
+
+    day = normalize_day(args.day)
+    registry = discover()
+    if day not in registry:
+        print(f"No registered solvers for {day}", file=sys.stderr)
+        return 1
+    variants = registry[day]
+    input_paths = resolve_inputs(variants[0].directory, args.input)
+    input_paths += [write_input(day, scale, args.seed) for scale in args.scale]
+    parts = parse_parts(args.part)
+
+    baseline = None
+    if args.compare:
+        with open(args.compare, "r") as f:
+            baseline = json.load(f)
+
+    results = []
+    for part in parts:
+        results += benchmark(variants, part, input_paths, args.repeat)
+    if not results:
+        print(f"No variant of {day} provides {' or '.join(parts)} for the given inputs", file=sys.stderr)
+        return 1
+    print(format_table(results, baseline))
+
+    if args.save:
+        with open(args.save, "w") as f:
+            json.dump({result_key(r): asdict(r) for r in results}, f, indent=2, default=str)
+    return 1 if any(not r.agrees for r in results) else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
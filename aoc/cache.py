@@ -0,0 +1,169 @@
+"""
+On-disk answer cache for solver runs.
+
+An answer is stored under (day, part, variant, SHA-256 of the input, hash of the solver
+source), so editing either the input or the solver (or a shared ``aoc`` module the
+solver imports) invalidates it. Entries are small JSON files; the least recently used
+ones are evicted once the cache holds more than ``max_entries``.
+"""
+import ast
+import hashlib
+import json
+import os
+
+from aoc.registry import ROOT, Variant
+
+DEFAULT_DIR = os.environ.get("AOC_CACHE_DIR", os.path.join(ROOT, ".aoc_cache"))
+DEFAULT_MAX_ENTRIES = 10000
+
+_file_hashes = {}
+
+
+def file_sha256(path: str) -> str:
+    """
+    SHA-256 of a file, memoized on (path, size, mtime) so batch reruns hash each input once.
+    """
+    stat = os.stat(path)
+    key = (os.path.abspath(path), stat.st_size, stat.st_mtime_ns)
+    digest = _file_hashes.get(key)
+    if digest is None:
+        h = hashlib.sha256()
+        with open(path, "rb") as f:
+            for chunk in iter(lambda: f.read(1 << 20), b""):
+                h.update(chunk)
+        digest = _file_hashes[key] = h.hexdigest()
+    return digest
+
+
+def _imported_aoc_modules(source: bytes) -> list[str]:
+    try:
+        tree = ast.parse(source)
+    except SyntaxError:
+        return []
+    names = set()
+    for node in ast.walk(tree):
+        if isinstance(node, ast.Import):
+            names.update(alias.name for alias in node.names if alias.name.startswith("aoc"))
+        elif isinstance(node, ast.ImportFrom) and node.module and node.module.startswith("aoc"):
+            names.add(node.module)
+    return sorted(names)
+
+
+def solver_hash(variant: Variant) -> str:
+    """
+    Hash of the variant's source plus the source of every ``aoc`` module it imports.
+    """
+    with open(variant.path, "rb") as f:
+        source = f.read()
+    h = hashlib.sha256(source)
+    for module in _imported_aoc_modules(source):
+        base = os.path.join(ROOT, *module.split("."))
+        for candidate in (base + ".py", os.path.join(base, "__init__.py")):
+            if os.path.exists(candidate):
+                h.update(module.encode())
+                h.update(file_sha256(candidate).encode())
+                break
+    return h.hexdigest()
+
+
+def to_json(answer):
+    """
+    Plain JSON value for an answer; numpy scalars become Python numbers.
+    """
+    if hasattr(answer, "item") and callable(answer.item):
+        answer = answer.item()
+    json.dumps(answer)  # raises TypeError for anything that cannot be cached
+    return answer
+
+
+class ResultCache:
+    """
+    Size-bounded LRU cache of answers on disk.
+
+    Args:
+        directory (str): Where entries are stored.
+        max_entries (int): Entries kept before the least recently used are evicted.
+        enabled (bool): False turns every lookup into a miss and every store into a no-op.
+    """
+
+    def __init__(self, directory: str = DEFAULT_DIR, max_entries: int = DEFAULT_MAX_ENTRIES, enabled: bool = True):
+        self.directory = directory
+        self.max_entries = max_entries
+        self.enabled = enabled
+        self.hits = 0
+        self.misses = 0
+        self._count = None  # entries on disk, counted lazily on the first store
+
+    def key(self, variant: Variant, part: str, input_path: str) -> str:
+        parts = (variant.day, part, variant.name, file_sha256(input_path), solver_hash(variant))
+        return hashlib.sha256("\0".join(parts).encode()).hexdigest()
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.directory, key[:2], key + ".json")
+
+    def get(self, key: str):
+        """
+        Return ``(True, answer)`` on a hit and ``(False, None)`` on a miss.
+        """
+        if not self.enabled:
+            return False, None
+        path = self._path(key)
+        try:
+            with open(path, "r") as f:
+                entry = json.load(f)
+        except (OSError, ValueError):
+            self.misses += 1
+            return False, None
+        os.utime(path)  # mtime doubles as the LRU timestamp
+        self.hits += 1
+        return True, entry["answer"]
+
+    def put(self, key: str, answer, **metadata):
+        if not self.enabled:
+            return
+        try:
+            entry = {"answer": to_json(answer), **metadata}
+        except TypeError:
+            return
+        path = self._path(key)
+        if self._count is None:
+            self._count = len(self.entries())
+        if not os.path.exists(path):
+            self._count += 1
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        tmp_path = path + ".tmp"
+        with open(tmp_path, "w") as f:
+            json.dump(entry, f)
+        os.replace(tmp_path, path)
+        if self._count > self.max_entries:
+            self.evict()
+
+    def entries(self) -> list[tuple[float, str]]:
+        found = []
+        if not os.path.isdir(self.directory):
+            return found
+        for shard in os.scandir(self.directory):
+            if shard.is_dir():
+                found += [(e.stat().st_mtime, e.path) for e in os.scandir(shard.path) if e.name.endswith(".json")]
+        return found
+
+    def evict(self):
+        """
+        Drop least recently used entries beyond ``max_entries``.
+        """
+        entries = self.entries()
+        self._count = len(entries)
+        if len(entries) <= self.max_entries:
+            return
+        entries.sort()
+        for _, path in entries[:len(entries) - self.max_entries]:
+            try:
+                os.remove(path)
+                self._count -= 1
+            except OSError:
+                pass
+
+    def clear(self):
+        for _, path in self.entries():
+            os.remove(path)
+        self._count = 0
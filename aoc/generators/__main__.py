@@ -0,0 +1,28 @@
+import argparse
+import sys
+
+from aoc.generators import GENERATORS, generate, write_input
+from aoc.registry import natural_key
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Generate synthetic puzzle inputs.")
+    parser.add_argument("day", nargs="?", help="day number or folder name")
+    parser.add_argument("--scale", type=float, default=1, help="size multiplier relative to a real input")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("-o", "--output", help="output file (default: stdout)")
+    parser.add_argument("--list", action="store_true", help="list days with a generator")
+    args = parser.parse_args(argv)
+
+    if args.list or args.day is None:
+        print(" ".join(sorted(GENERATORS, key=natural_key)))
+        return 0
+    if args.output:
+        print(write_input(args.day, args.scale, args.seed, args.output))
+    else:
+        sys.stdout.write(generate(args.day, args.scale, args.seed))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
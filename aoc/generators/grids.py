@@ -0,0 +1,296 @@
+"""
+Generators for the grid days: 4, 6, 8, 10, 12, 15, 16, 18, 20 and 2023 day 21.
+"""
+import math
+import string
+from collections import deque
+
+from aoc.generators import register
+
+GUARD_ROUTE_SHARE = 0.25   # day 6: share of the map the guard walks (4374 / 130**2 in a real input)
+OBSTACLE_SHARE = 0.047     # day 6: share of cells holding an obstacle in a real input
+
+
+def scaled_side(base: int, scale: float, odd: bool = False) -> int:
+    side = max(5, round(base * math.sqrt(scale)))
+    if odd and side % 2 == 0:
+        side += 1
+    return side
+
+
+def join_rows(rows) -> str:
+    return "\n".join("".join(row) for row in rows) + "\n"
+
+
+def carve_maze(rng, side: int, loop_chance: float = 0.0) -> list[list[str]]:
+    """
+    Iterative randomized DFS maze on the odd cells of a ``side`` x ``side`` grid
+    (``side`` must be odd). ``loop_chance`` knocks out extra walls so there are
+    several routes between two cells.
+    """
+    grid = [["#"] * side for _ in range(side)]
+    grid[1][1] = "."
+    stack = [(1, 1)]
+    while stack:
+        r, c = stack[-1]
+        options = [(r + dr, c + dc, dr // 2, dc // 2)
+                   for dr, dc in ((-2, 0), (2, 0), (0, -2), (0, 2))
+                   if 0 < r + dr < side - 1 and 0 < c + dc < side - 1 and grid[r + dr][c + dc] == "#"]
+        if not options:
+            stack.pop()
+            continue
+        nr, nc, hr, hc = rng.choice(options)
+        grid[r + hr][c + hc] = "."
+        grid[nr][nc] = "."
+        stack.append((nr, nc))
+
+    if loop_chance:
+        for r in range(1, side - 1):
+            for c in range(1, side - 1):
+                if grid[r][c] == "#" and (r % 2) != (c % 2) and rng.random() < loop_chance:
+                    grid[r][c] = "."
+    return grid
+
+
+def bfs_path(grid, start, end) -> list[tuple[int, int]]:
+    prev = {start: None}
+    queue = deque([start])
+    while queue:
+        cur = queue.popleft()
+        if cur == end:
+            break
+        r, c = cur
+        for nxt in ((r - 1, c), (r + 1, c), (r, c - 1), (r, c + 1)):
+            if nxt not in prev and grid[nxt[0]][nxt[1]] != "#":
+                prev[nxt] = cur
+                queue.append(nxt)
+    path = []
+    cur = end
+    while cur is not None:
+        path.append(cur)
+        cur = prev[cur]
+    return path[::-1]
+
+
+@register("day4")
+def word_search(rng, scale):
+    side = scaled_side(140, scale)
+    return join_rows(rng.choices("XMAS", k=side) for _ in range(side))
+
+
+def patrol_length(grid, r: int, c: int) -> int | None:
+    """
+    Number of distinct cells a guard starting at (r, c) facing up visits before it walks
+    off the map (turning right at ``#``), or None if it patrols in a loop instead.
+    """
+    side = len(grid)
+    dr, dc = -1, 0
+    seen = {(r, c)}
+    turns = set()
+    while True:
+        nr, nc = r + dr, c + dc
+        if not (0 <= nr < side and 0 <= nc < side):
+            return len(seen)
+        if grid[nr][nc] == "#":
+            dr, dc = dc, -dr
+            if (r, c, dr, dc) in turns:
+                return None
+            turns.add((r, c, dr, dc))
+        else:
+            r, c = nr, nc
+            seen.add((r, c))
+
+
+def plan_patrol(rng, side: int, r: int, c: int, target: int):
+    """
+    Lay out a guard route of at least ``target`` cells that ends by walking off the map,
+    one straight run at a time, placing the obstacle that ends each run.
+
+    A run may stop in front of any cell not walked yet (it becomes the obstacle) or at an
+    obstacle already placed, but never reaches a cell it has walked in the same direction
+    before: from a repeated (cell, direction) the guard would retrace its route forever.
+
+    Returns:
+        tuple: (obstacle cells, route cells), or None if the route got boxed in.
+    """
+    blocked = set()
+    seen = {(r, c)}
+    states = {(r, c, -1, 0)}
+    dr, dc = -1, 0
+    while True:
+        ray = []
+        nr, nc = r + dr, c + dc
+        while 0 <= nr < side and 0 <= nc < side and (nr, nc) not in blocked and (nr, nc, dr, dc) not in states:
+            ray.append((nr, nc))
+            nr, nc = nr + dr, nc + dc
+        inside = 0 <= nr < side and 0 <= nc < side
+        if not inside and len(seen) + sum(cell not in seen for cell in ray) >= target:
+            seen.update(ray)
+            return blocked, seen
+
+        # Index of the cell in ``ray`` the run stops in front of; len(ray) is an obstacle already there
+        stops = [i for i, cell in enumerate(ray) if cell not in seen]
+        if inside and (nr, nc) in blocked:
+            stops.append(len(ray))
+        rng.shuffle(stops)
+        ndr, ndc = dc, -dr
+        for i in stops:
+            tr, tc = ray[i - 1] if i else (r, c)
+            if (tr, tc, ndr, ndc) not in states:
+                break
+        else:
+            return None
+        for cr, cc in ray[:i]:
+            seen.add((cr, cc))
+            states.add((cr, cc, dr, dc))
+        if i < len(ray):
+            blocked.add(ray[i])
+        r, c, dr, dc = tr, tc, ndr, ndc
+        states.add((r, c, dr, dc))
+
+
+@register("day6")
+def guard_map(rng, scale):
+    """
+    Like a real input (130 x 130, route of 4374 cells, 4.7% obstacles), the guard patrols
+    about a quarter of the map and then leaves it, so the route grows with the area.
+    The route is planned first; the other obstacles are scattered off it, where they
+    cannot change it. Maps whose route comes out short or loops are re-drawn.
+    """
+    side = scaled_side(130, scale)
+    area = side * side
+    target = round(GUARD_ROUTE_SHARE * area)
+    while True:
+        r, c = rng.randrange(side), rng.randrange(side)
+        planned = plan_patrol(rng, side, r, c, target)
+        if planned is None:
+            continue
+        blocked, seen = planned
+        density = max(0.0, (OBSTACLE_SHARE * area - len(blocked)) / (area - len(seen) - len(blocked)))
+        grid = [["#" if (y, x) in blocked or ((y, x) not in seen and rng.random() < density) else "."
+                 for x in range(side)] for y in range(side)]
+        length = patrol_length(grid, r, c)
+        if length is not None and length >= target:
+            grid[r][c] = "^"
+            return join_rows(grid)
+
+
+@register("day8")
+def antenna_map(rng, scale):
+    side = scaled_side(50, scale)
+    grid = [["."] * side for _ in range(side)]
+    frequencies = string.digits + string.ascii_letters
+    for _ in range(min(round(200 * scale), side * side // 2)):
+        grid[rng.randrange(side)][rng.randrange(side)] = rng.choice(frequencies)
+    return join_rows(grid)
+
+
+@register("day10")
+def topographic_map(rng, scale):
+    side = scaled_side(57, scale)
+    peaks = [(rng.randrange(side), rng.randrange(side)) for _ in range(max(1, round(side * side / 120)))]
+    # Manhattan distance to the nearest peak, via multi-source BFS, gives slopes of step 1
+    dist = [[-1] * side for _ in range(side)]
+    queue = deque()
+    for r, c in peaks:
+        dist[r][c] = 0
+        queue.append((r, c))
+    while queue:
+        r, c = queue.popleft()
+        for nr, nc in ((r - 1, c), (r + 1, c), (r, c - 1), (r, c + 1)):
+            if 0 <= nr < side and 0 <= nc < side and dist[nr][nc] < 0:
+                dist[nr][nc] = dist[r][c] + 1
+                queue.append((nr, nc))
+    rows = []
+    for r in range(side):
+        row = []
+        for c in range(side):
+            height = max(0, 9 - dist[r][c])
+            if rng.random() < 0.1:
+                height = rng.randrange(10)
+            row.append(str(height))
+        rows.append(row)
+    return join_rows(rows)
+
+
+@register("day12")
+def garden_plots(rng, scale):
+    side = scaled_side(140, scale)
+    block = 6
+    coarse_side = side // block + 2
+    coarse = [[rng.choice(string.ascii_uppercase) for _ in range(coarse_side)] for _ in range(coarse_side)]
+    rows = []
+    for r in range(side):
+        row = []
+        for c in range(side):
+            jr, jc = rng.randrange(-1, 2), rng.randrange(-1, 2)
+            row.append(coarse[max(0, (r + jr) // block)][max(0, (c + jc) // block)])
+        rows.append(row)
+    return join_rows(rows)
+
+
+@register("day15")
+def warehouse(rng, scale):
+    side = scaled_side(50, scale)
+    grid = [["#"] * side]
+    for _ in range(side - 2):
+        row = ["#"]
+        for _ in range(side - 2):
+            x = rng.random()
+            row.append("#" if x < 0.08 else "O" if x < 0.45 else ".")
+        row.append("#")
+        grid.append(row)
+    grid.append(["#"] * side)
+    mid = side // 2
+    grid[mid][mid] = "@"
+
+    moves = rng.choices("<>^v", k=round(20000 * scale))
+    move_lines = ["".join(moves[i:i + 1000]) for i in range(0, len(moves), 1000)]
+    return join_rows(grid) + "\n" + "\n".join(move_lines) + "\n"
+
+
+@register("day16")
+def reindeer_maze(rng, scale):
+    side = scaled_side(141, scale, odd=True)
+    grid = carve_maze(rng, side, loop_chance=0.08)
+    grid[side - 2][1] = "S"
+    grid[1][side - 2] = "E"
+    return join_rows(grid)
+
+
+@register("day18")
+def falling_bytes(rng, scale):
+    """
+    Byte positions on a ``side`` x ``side`` memory space (71 for a real input).
+    """
+    side = scaled_side(71, scale)
+    cells = [(x, y) for y in range(side) for x in range(side)
+             if (x, y) not in ((0, 0), (side - 1, side - 1))]
+    rng.shuffle(cells)
+    count = round(len(cells) * 0.69)
+    return "\n".join(f"{x},{y}" for x, y in cells[:count]) + "\n"
+
+
+@register("day20")
+def racetrack(rng, scale):
+    side = scaled_side(141, scale, odd=True)
+    maze = carve_maze(rng, side)
+    start, end = (side - 2, 1), (1, side - 2)
+    path = bfs_path(maze, start, end)
+    grid = [["#"] * side for _ in range(side)]
+    for r, c in path:
+        grid[r][c] = "."
+    grid[start[0]][start[1]] = "S"
+    grid[end[0]][end[1]] = "E"
+    return join_rows(grid)
+
+
+@register("2023day21")
+def garden_steps(rng, scale):
+    side = scaled_side(131, scale, odd=True)
+    mid = side // 2
+    # The real map keeps the border, the middle row and the middle column free of rocks
+    grid = [["#" if 0 < r < side - 1 and 0 < c < side - 1 and mid not in (r, c) and rng.random() < 0.15
+             else "." for c in range(side)] for r in range(side)]
+    grid[mid][mid] = "S"
+    return join_rows(grid)
@@ -0,0 +1,110 @@
+"""
+Generators for the number list days: 1, 2, 7, 9, 11, 13, 14, 17 and 22.
+"""
+from aoc.generators import register
+
+
+def lines(rows) -> str:
+    return "\n".join(rows) + "\n"
+
+
+@register("day1")
+def location_lists(rng, scale):
+    count = round(1000 * scale)
+    left = [rng.randrange(10000, 100000) for _ in range(count)]
+    # Roughly a third of the right column repeats left values, so part 2 has something to count
+    right = [rng.choice(left) if rng.random() < 0.3 else rng.randrange(10000, 100000) for _ in range(count)]
+    return lines(f"{a}   {b}" for a, b in zip(left, right))
+
+
+@register("day2")
+def reports(rng, scale):
+    rows = []
+    for _ in range(round(1000 * scale)):
+        length = rng.randint(5, 8)
+        direction = rng.choice((-1, 1))
+        levels = [rng.randint(30, 70)]
+        for _ in range(length - 1):
+            levels.append(levels[-1] + direction * rng.randint(1, 3))
+        if rng.random() < 0.5:
+            # One bad level: a repeat, a jump or a change of direction
+            i = rng.randrange(length)
+            levels[i] += rng.choice((-5, -4, -1, 0, 1, 4, 5))
+        rows.append(" ".join(map(str, levels)))
+    return lines(rows)
+
+
+def random_operand(rng) -> int:
+    digits = rng.choices((1, 2, 3), weights=(6, 3, 1))[0]
+    return rng.randrange(10 ** (digits - 1) if digits > 1 else 1, 10 ** digits)
+
+
+@register("day7")
+def calibration_equations(rng, scale):
+    rows = []
+    for _ in range(round(850 * scale)):
+        nums = [random_operand(rng) for _ in range(rng.randint(3, 12))]
+        target = nums[0]
+        for n in nums[1:]:
+            op = rng.choice("+*|")
+            target = target + n if op == "+" else target * n if op == "*" else int(f"{target}{n}")
+        if rng.random() < 0.4:
+            target += rng.randint(1, 9)  # most likely unsolvable now
+        rows.append(f"{target}: {' '.join(map(str, nums))}")
+    return lines(rows)
+
+
+@register("day9")
+def disk_map(rng, scale):
+    files = round(10000 * scale)
+    digits = []
+    for i in range(files):
+        digits.append(str(rng.randint(1, 9)))
+        if i < files - 1:
+            digits.append(str(rng.randint(0, 9)))
+    return "".join(digits) + "\n"
+
+
+@register("day11")
+def stones(rng, scale):
+    return " ".join(str(rng.randrange(10 ** rng.randint(1, 7))) for _ in range(max(1, round(8 * scale)))) + "\n"
+
+
+@register("day13")
+def claw_machines(rng, scale):
+    blocks = []
+    for _ in range(round(320 * scale)):
+        ax, ay, bx, by = (rng.randint(10, 99) for _ in range(4))
+        if rng.random() < 0.5:
+            a, b = rng.randint(1, 100), rng.randint(1, 100)
+            px, py = a * ax + b * bx, a * ay + b * by
+        else:
+            px, py = rng.randint(1000, 20000), rng.randint(1000, 20000)
+        blocks.append(f"Button A: X+{ax}, Y+{ay}\nButton B: X+{bx}, Y+{by}\nPrize: X={px}, Y={py}")
+    return "\n\n".join(blocks) + "\n"
+
+
+@register("day14")
+def robots(rng, scale):
+    width, height = 101, 103
+    return lines(f"p={rng.randrange(width)},{rng.randrange(height)} v={rng.randint(-99, 99)},{rng.randint(-99, 99)}"
+                 for _ in range(round(500 * scale)))
+
+
+@register("day17")
+def chronospatial_program(rng, scale):
+    """
+    The usual ``bst/bxl/cdv/bxl/adv/bxc/out/jnz`` program; scale grows register A,
+    and with it the number of loop iterations and outputs (16 for a real input).
+    """
+    bits = max(3, round(48 * scale))
+    register_a = rng.getrandbits(bits) | (1 << (bits - 1))
+    b1, b2 = rng.randrange(1, 8), rng.randrange(1, 8)
+    program = [2, 4, 1, b1, 7, 5, 1, b2, 0, 3, 4, 2, 5, 5, 3, 0]
+    return (f"Register A: {register_a}\nRegister B: 0\nRegister C: 0\n\n"
+            f"Program: {','.join(map(str, program))}\n")
+
+
+@register("day22")
+def secrets(rng, scale):
+    return lines(str(rng.randrange(1, 1 << 24)) for _ in range(round(1700 * scale)))
@@ -0,0 +1,183 @@
+"""
+Generators for the text and graph days: 3, 5, 19, 21, 23, 24, 25 and 2023 day 25.
+"""
+import itertools
+import string
+
+from aoc.generators import register
+
+JUNK = "()[]{}<>,'!@#$%^&*+-;:?/ "
+DECOYS = ("mul[3,7]", "mul(4*", "mul ( 2 , 4 )", "mul(32,64]", "mul(1234,5)", "don't", "do(",
+          "who()", "select()", "from()", "what()", "why()", "how()", "when()", "undo()")
+
+
+def node_names(count: int, alphabet: str = string.ascii_lowercase, min_length: int = 2) -> list[str]:
+    """
+    ``count`` distinct names, as short as possible but at least ``min_length`` letters.
+    """
+    length = min_length
+    while len(alphabet) ** length < count:
+        length += 1
+    names = ("".join(p) for p in itertools.product(alphabet, repeat=length))
+    return list(itertools.islice(names, count))
+
+
+@register("day3")
+def corrupted_memory(rng, scale):
+    target = round(18000 * scale)
+    out = []
+    size = 0
+    since_newline = 0
+    while size < target:
+        x = rng.random()
+        if x < 0.05:
+            token = f"mul({rng.randint(1, 999)},{rng.randint(1, 999)})"
+        elif x < 0.06:
+            token = rng.choice(("do()", "don't()"))
+        elif x < 0.08:
+            token = rng.choice(DECOYS)
+        else:
+            token = rng.choice(JUNK + "muldont")
+        out.append(token)
+        size += len(token)
+        since_newline += len(token)
+        if since_newline > 3000:
+            out.append("\n")
+            since_newline = 0
+    return "".join(out) + "\n"
+
+
+@register("day5")
+def print_queue(rng, scale):
+    """
+    Rules cover every pair of 49 two-digit pages (one total order), like a real input,
+    so every update has exactly one correct ordering.
+    """
+    pages = rng.sample(range(10, 100), 49)
+    rank = {page: i for i, page in enumerate(pages)}
+    rules = [(x, y) for x, y in itertools.combinations(pages, 2)]
+    rng.shuffle(rules)
+
+    updates = []
+    for _ in range(round(200 * scale)):
+        update = rng.sample(pages, rng.randrange(5, 24, 2))
+        if rng.random() < 0.5:
+            update.sort(key=rank.__getitem__)
+        updates.append(",".join(map(str, update)))
+    return "\n".join(f"{x}|{y}" for x, y in rules) + "\n\n" + "\n".join(updates) + "\n"
+
+
+@register("day19")
+def towels(rng, scale):
+    colors = "wubrg"
+    patterns = sorted({"".join(rng.choices(colors, k=rng.randint(1, 8))) for _ in range(450)} - {"r"})
+    designs = []
+    for _ in range(round(400 * scale)):
+        if rng.random() < 0.6:
+            design, length = "", rng.randint(20, 60)
+            while len(design) < length:
+                design += rng.choice(patterns)
+        else:
+            design = "".join(rng.choices(colors, k=rng.randint(20, 60)))
+        designs.append(design)
+    return ", ".join(patterns) + "\n\n" + "\n".join(designs) + "\n"
+
+
+@register("day21")
+def door_codes(rng, scale):
+    return "\n".join(f"{rng.randrange(1000):03d}A" for _ in range(max(1, round(5 * scale)))) + "\n"
+
+
+@register("day23")
+def lan_party(rng, scale):
+    names = node_names(round(520 * scale))
+    rng.shuffle(names)
+    edges = set()
+    for a in names:
+        for b in rng.sample(names, min(7, len(names))):
+            if a != b:
+                edges.add(tuple(sorted((a, b))))
+    # The largest clique a real input hides has 13 computers
+    clique = rng.sample(names, min(13, len(names)))
+    edges.update(tuple(sorted(pair)) for pair in itertools.combinations(clique, 2))
+    edges = [rng.choice((f"{a}-{b}", f"{b}-{a}")) for a, b in edges]
+    rng.shuffle(edges)
+    return "\n".join(edges) + "\n"
+
+
+@register("day24")
+def crossed_wires(rng, scale):
+    """
+    Ripple-carry adder over ``45 * scale`` bits with four pairs of swapped gate outputs,
+    the same shape as a real input.
+    """
+    bits = max(2, round(45 * scale))
+    width = max(2, len(str(bits)))
+    x = [f"x{i:0{width}d}" for i in range(bits)]
+    y = [f"y{i:0{width}d}" for i in range(bits)]
+    z = [f"z{i:0{width}d}" for i in range(bits + 1)]
+    # Internal wire names never start with x, y or z
+    internal = iter(rng.sample(node_names(5 * bits, alphabet="abcdefghijklmnopqrstuvw", min_length=3), 5 * bits))
+
+    gates = [(x[0], "XOR", y[0], z[0])]
+    carry = next(internal)
+    gates.append((x[0], "AND", y[0], carry))
+    for i in range(1, bits):
+        partial, direct, chained = next(internal), next(internal), next(internal)
+        new_carry = z[bits] if i == bits - 1 else next(internal)
+        gates += [
+            (x[i], "XOR", y[i], partial),
+            (x[i], "AND", y[i], direct),
+            (partial, "XOR", carry, z[i]),
+            (partial, "AND", carry, chained),
+            (direct, "OR", chained, new_carry),
+        ]
+        carry = new_carry
+
+    swaps = rng.sample(range(len(gates)), min(8, len(gates) - len(gates) % 2))
+    for a, b in zip(swaps[::2], swaps[1::2]):
+        gates[a], gates[b] = gates[a][:3] + (gates[b][3],), gates[b][:3] + (gates[a][3],)
+    rng.shuffle(gates)
+
+    values = [f"{w}: {rng.randint(0, 1)}" for w in x] + [f"{w}: {rng.randint(0, 1)}" for w in y]
+    return ("\n".join(values) + "\n\n"
+            + "\n".join(f"{a} {op} {b} -> {out}" for a, op, b, out in gates) + "\n")
+
+
+@register("day25")
+def schematics(rng, scale):
+    blocks = []
+    for _ in range(round(500 * scale)):
+        heights = [rng.randint(0, 5) for _ in range(5)]
+        is_lock = rng.random() < 0.5
+        rows = []
+        for r in range(7):
+            level = r if is_lock else 6 - r  # locks hang from the top, keys stand on the bottom
+            rows.append("".join("#" if level == 0 or level <= h else "." for h in heights))
+        blocks.append("\n".join(rows))
+    return "\n\n".join(blocks) + "\n"
+
+
+@register("2023day25")
+def snowverload(rng, scale):
+    """
+    Two dense halves joined by exactly three wires, so the three-cut is unique.
+    """
+    names = node_names(round(1500 * scale), min_length=3)
+    rng.shuffle(names)
+    half = len(names) // 2
+    adjacency = {name: set() for name in names}
+
+    def connect(a, b):
+        if a != b and b not in adjacency[a] and a not in adjacency[b]:
+            adjacency[a].add(b)
+
+    for group in (names[:half], names[half:]):
+        for i, a in enumerate(group):
+            if i:
+                connect(a, group[rng.randrange(i)])  # keeps each half connected
+            for b in rng.sample(group, min(3, len(group))):
+                connect(a, b)
+    for a, b in zip(rng.sample(names[:half], 3), rng.sample(names[half:], 3)):
+        connect(a, b)
+    return "\n".join(f"{a}: {' '.join(sorted(bs))}" for a, bs in adjacency.items() if bs) + "\n"
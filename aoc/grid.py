@@ -0,0 +1,112 @@
+"""
+Zero-copy grid loading shared by the grid days.
+
+The input file is memory-mapped and the row terminators are sliced away, so the
+grid is a 2-D ``uint8`` view straight over the file bytes: no per-cell Python
+objects, and nothing is read until a cell is touched. Compare cells against byte
+values, e.g. ``grid == ord("#")`` or ``grid == b"#"[0]``.
+"""
+import mmap
+import os
+
+import numpy as np
+
+# (dr, dc) offsets, in the order up, right, down, left (turning right = index + 1)
+NEIGHBORS4 = np.array([(-1, 0), (0, 1), (1, 0), (0, -1)], dtype=np.intp)
+NEIGHBORS8 = np.array([(-1, 0), (-1, 1), (0, 1), (1, 1), (1, 0), (1, -1), (0, -1), (-1, -1)], dtype=np.intp)
+DIRECTIONS = {"^": 0, ">": 1, "v": 2, "<": 3}
+
+
+def _layout(buffer) -> tuple[int, int, int]:
+    """
+    Work out (rows, width, stride) of the grid block at the start of a buffer.
+    The block ends at the first empty line or at the end of the buffer.
+    """
+    first_newline = buffer.find(b"\n")
+    if first_newline < 0:
+        return (1, len(buffer), len(buffer)) if len(buffer) else (0, 0, 0)
+    width = first_newline - 1 if first_newline and buffer[first_newline - 1:first_newline] == b"\r" else first_newline
+    stride = first_newline + 1
+    terminator = bytes(buffer[width:stride])
+    end = buffer.find(terminator * 2)
+    if end < 0:
+        end = len(buffer)
+        if buffer[end - len(terminator):end] == terminator:
+            end -= len(terminator)
+    rows = (end + len(terminator)) // stride
+    return rows, width, stride
+
+
+def load_grid(file_path: str) -> np.ndarray:
+    """
+    Memory-map a grid file as a read-only 2-D ``uint8`` array.
+
+    Works for plain grids and for inputs where the grid is followed by an empty line and
+    more data (day 15). Files whose last row has no newline are copied instead of mapped.
+
+    Args:
+        file_path (str): Path to the input file.
+
+    Returns:
+        np.ndarray: Array of shape (rows, width) with the raw byte of every cell.
+    """
+    if os.path.getsize(file_path) == 0:
+        return np.zeros((0, 0), dtype=np.uint8)
+    with open(file_path, "rb") as f:
+        mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    rows, width, stride = _layout(mapped)
+    data = np.frombuffer(mapped, dtype=np.uint8)  # the array keeps the mapping alive
+    if rows * stride <= len(data):
+        return data[:rows * stride].reshape(rows, stride)[:, :width]
+    # Last row is not newline-terminated, so rows do not tile the file; pad one copy
+    tail = np.empty(rows * stride, dtype=np.uint8)
+    tail[:len(data)] = data
+    tail[len(data):] = ord("\n")
+    tail.flags.writeable = False
+    return tail.reshape(rows, stride)[:, :width]
+
+
+def grid_from_lines(lines: list[str]) -> np.ndarray:
+    """
+    Build the same ``uint8`` representation from a list of equal-length strings.
+    """
+    if not lines:
+        return np.zeros((0, 0), dtype=np.uint8)
+    return np.frombuffer("".join(lines).encode("ascii"), dtype=np.uint8).reshape(len(lines), -1)
+
+
+def find(grid: np.ndarray, marker: str) -> tuple[int, int] | None:
+    """
+    Position (row, col) of the first cell holding ``marker`` (e.g. "S", "E", "^", "@"), or None.
+    """
+    flat = np.flatnonzero(grid == ord(marker))
+    if flat.size == 0:
+        return None
+    r, c = divmod(int(flat[0]), grid.shape[1])
+    return r, c
+
+
+def find_all(grid: np.ndarray, marker: str) -> np.ndarray:
+    """
+    Positions of every cell holding ``marker`` as an array of shape (n, 2).
+    """
+    return np.argwhere(grid == ord(marker))
+
+
+def padded(grid: np.ndarray, pad: int = 1, fill: str = "#") -> np.ndarray:
+    """
+    Writable copy of the grid surrounded by ``pad`` cells of ``fill`` on every side,
+    so neighbor lookups never need a bounds check.
+    """
+    return np.pad(grid, pad, mode="constant", constant_values=ord(fill))
+
+
+def in_bounds(grid: np.ndarray, r: int, c: int) -> bool:
+    return 0 <= r < grid.shape[0] and 0 <= c < grid.shape[1]
+
+
+def to_lines(grid: np.ndarray) -> list[str]:
+    """
+    Back to a list of strings, for solvers that still expect ``read_grid`` output.
+    """
+    return [row.tobytes().decode("ascii") for row in grid]
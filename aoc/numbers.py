@@ -0,0 +1,57 @@
+"""
+Chunked parsing of whitespace-separated integers, shared by the days whose input is
+plain columns of numbers.
+
+The file is read a chunk at a time and cut at the last newline, and every piece is
+parsed by NumPy in C (``np.fromstring`` with a whitespace separator), so no Python
+object is created per number and memory is bounded by the chunk size.
+"""
+import os
+
+import numpy as np
+
+CHUNK_BYTES = 1 << 26  # 64 MB of text per parse step
+
+
+def _parse(text: bytes) -> np.ndarray:
+    return np.fromstring(text.decode("ascii"), dtype=np.int64, sep=" ")
+
+
+def iter_number_chunks(file_path: str, chunk_bytes: int = CHUNK_BYTES):
+    """
+    Yield the numbers of consecutive pieces of the file as ``int64`` arrays. Pieces end
+    at line ends, so a piece always holds whole lines.
+
+    Args:
+        file_path (str): Path to the input file.
+        chunk_bytes (int): Bytes of text read at once; bounds the temporary memory.
+    """
+    rest = b""
+    with open(file_path, "rb") as f:
+        # Never ask for more than the file holds: read(n) allocates n bytes up front
+        chunk_bytes = max(1, min(chunk_bytes, os.fstat(f.fileno()).st_size))
+        while True:
+            chunk = f.read(chunk_bytes)
+            if not chunk:
+                break
+            chunk = rest + chunk
+            cut = chunk.rfind(b"\n") + 1
+            if cut == 0:
+                rest = chunk
+                continue
+            rest = chunk[cut:]
+            # np.fromstring parses blank text as [0], so whitespace-only pieces are skipped
+            if chunk[:cut].strip():
+                yield _parse(chunk[:cut])
+    if rest.strip():
+        yield _parse(rest)
+
+
+def split_pairs(values: np.ndarray, file_path: str) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Split a flat array of numbers read two per line into its (left, right) columns.
+    """
+    if values.size % 2:
+        raise ValueError(f"{file_path}: expected two numbers per line")
+    pairs = values.reshape(-1, 2)
+    return pairs[:, 0], pairs[:, 1]
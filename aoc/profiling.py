@@ -0,0 +1,173 @@
+"""
+Profiling hooks for solver runs.
+
+Counters:
+    Solvers count hot-path events through one shared ``Counter``. Guard every update
+    with ``profiling.active`` so a disabled counter costs one attribute lookup::
+
+        from aoc import profiling
+        ...
+        if profiling.active:
+            profiling.counters["bfs_expansions"] += 1
+
+Profilers:
+    ``profile_call(func, *args, mode="cprofile")`` runs a function under cProfile and
+    ``mode="sample"`` under a sampling profiler. Both write collapsed stacks
+    (``frame;frame;frame count``), the input format of flamegraph.pl and speedscope.
+"""
+import cProfile
+import io
+import os
+import pstats
+import sys
+import threading
+from collections import Counter
+from contextlib import contextmanager
+
+active = False
+counters = Counter()
+
+
+def enable():
+    global active
+    active = True
+
+
+def disable():
+    global active
+    active = False
+
+
+def reset():
+    counters.clear()
+
+
+@contextmanager
+def collecting():
+    """
+    Enable counters for the duration of a block and hand back the (fresh) counters.
+    """
+    reset()
+    enable()
+    try:
+        yield counters
+    finally:
+        disable()
+
+
+def frame_label(code) -> str:
+    return f"{code.co_name} ({os.path.basename(code.co_filename)}:{code.co_firstlineno})"
+
+
+class Sampler:
+    """
+    Sampling profiler: a background thread records the target thread's stack every ``interval`` seconds.
+    Much lower overhead than cProfile on tight loops, at the price of statistical results.
+    """
+
+    def __init__(self, interval: float = 0.001, root_code=None):
+        self.interval = interval
+        self.root_code = root_code  # stacks are cut above this code object (the profiler's own frames)
+        self.stacks = Counter()
+        self._target = None
+        self._stop = threading.Event()
+        self._thread = None
+
+    def _run(self):
+        stop_code = Sampler.stop.__code__
+        while not self._stop.wait(self.interval):
+            frame = sys._current_frames().get(self._target)
+            stack = []
+            while frame is not None and frame.f_code is not self.root_code:
+                if frame.f_code is stop_code:  # the target is already shutting the sampler down
+                    stack = []
+                    break
+                stack.append(frame_label(frame.f_code))
+                frame = frame.f_back
+            if stack and not self._stop.is_set():
+                self.stacks[";".join(reversed(stack))] += 1
+
+    def start(self):
+        self._target = threading.get_ident()
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        self._stop.set()
+        self._thread.join()
+
+    def collapsed(self) -> str:
+        return "\n".join(f"{stack} {count}" for stack, count in self.stacks.most_common()) + "\n"
+
+
+def cprofile_collapsed(stats: pstats.Stats) -> str:
+    """
+    Approximate collapsed stacks from cProfile's caller/callee table.
+
+    cProfile only records one level of callers, so each line is ``caller;callee`` weighted
+    by the callee's own time in microseconds; good enough to spot the hot function.
+    """
+    lines = []
+    for func, (_, _, own_time, _, callers) in stats.stats.items():
+        label = f"{func[2]} ({os.path.basename(func[0])}:{func[1]})"
+        if not callers:
+            lines.append(f"{label} {max(1, round(own_time * 1e6))}")
+        total_calls = sum(c[0] for c in callers.values()) or 1
+        for caller, (calls, *_rest) in callers.items():
+            caller_label = f"{caller[2]} ({os.path.basename(caller[0])}:{caller[1]})"
+            weight = round(own_time * 1e6 * calls / total_calls)
+            if weight:
+                lines.append(f"{caller_label};{label} {weight}")
+    return "\n".join(lines) + "\n"
+
+
+def profile_call(func, *args, mode: str = "cprofile", output: str = None, interval: float = 0.001, top: int = 15):
+    """
+    Run ``func(*args)`` under a profiler.
+
+    Args:
+        func: Callable to profile, typically a ``part1``/``part2`` entry point.
+        mode (str): ``cprofile`` (deterministic) or ``sample`` (statistical).
+        output (str): Where to write collapsed stacks; ``.prof`` next to it gets the raw cProfile dump.
+        interval (float): Sampling interval in seconds for ``sample``.
+        top (int): Functions listed in the text report.
+
+    Returns:
+        tuple: (result of func, text report)
+    """
+    if mode == "cprofile":
+        profiler = cProfile.Profile()
+        result = profiler.runcall(func, *args)
+        text = io.StringIO()
+        stats = pstats.Stats(profiler, stream=text)
+        stats.sort_stats("cumulative").print_stats(top)
+        if output:
+            stats.dump_stats(os.path.splitext(output)[0] + ".prof")
+            with open(output, "w") as f:
+                f.write(cprofile_collapsed(stats))
+        return result, text.getvalue()
+
+    if mode == "sample":
+        sampler = Sampler(interval, root_code=profile_call.__code__)
+        sampler.start()
+        try:
+            result = func(*args)
+        finally:
+            sampler.stop()
+        if output:
+            with open(output, "w") as f:
+                f.write(sampler.collapsed())
+        total = sum(sampler.stacks.values()) or 1
+        own = Counter()
+        for stack, n in sampler.stacks.items():
+            own[stack.rsplit(";", 1)[-1]] += n
+        report = [f"{total} samples every {interval * 1000:g} ms"]
+        report += [f"{100 * n / total:6.1f}%  {label}" for label, n in own.most_common(top)]
+        return result, "\n".join(report) + "\n"
+
+    raise ValueError(f"Unknown profiler mode: {mode}")
+
+
+def format_counters(values: Counter) -> str:
+    return "  ".join(f"{name}={n}" for name, n in sorted(values.items()))
@@ -0,0 +1,151 @@
+import ast
+import importlib.util
+import os
+import re
+import sys
+from dataclasses import dataclass
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+DAY_DIR_PATTERN = re.compile(r"^(\d{4})?day(\d+)$")
+ENTRY_POINTS = ("part1", "part2")
+
+_loaded_modules = {}
+
+
+@dataclass(frozen=True)
+class Variant:
+    """
+    One solver script of a day that exposes ``part1``/``part2`` entry points.
+
+    Attributes:
+        day (str): Name of the day folder, e.g. ``day7`` or ``2023day21``.
+        name (str): Variant label, the file stem without the ``main`` prefix (``1.9``).
+        path (str): Absolute path of the script.
+        parts (tuple): Entry points the script defines, e.g. ``("part1", "part2")``.
+    """
+    day: str
+    name: str
+    path: str
+    parts: tuple
+
+    @property
+    def directory(self) -> str:
+        return os.path.dirname(self.path)
+
+    def input_path(self, input_name: str = "input.txt") -> str:
+        """
+        Resolve an input file name relative to the day folder.
+        Absolute paths and paths that already exist are returned untouched.
+        """
+        if os.path.isabs(input_name) or os.path.exists(input_name):
+            return input_name
+        return os.path.join(self.directory, input_name)
+
+
+def natural_key(text: str) -> tuple:
+    """
+    Sort key that orders ``1.9`` before ``1.10`` and ``day2`` before ``day10``.
+    """
+    return tuple((0, int(tok), "") if tok.isdigit() else (1, 0, tok)
+                 for tok in re.findall(r"\d+|[^\d.]+", text))
+
+
+def normalize_day(day) -> str:
+    """
+    Accept ``7``, ``"7"``, ``"day7"`` or ``"2023day21"`` and return the folder name.
+    """
+    day = str(day)
+    return day if "day" in day else f"day{day}"
+
+
+def variant_name(file_name: str) -> str:
+    stem = file_name[:-3] if file_name.endswith(".py") else file_name
+    return stem[len("main"):] if stem.startswith("main") and len(stem) > 4 else stem
+
+
+def _entry_points(path: str) -> tuple:
+    """
+    Find which entry points a script defines by parsing it, without importing it.
+    Most scripts read files and print at import time, so importing is not an option here.
+    """
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            tree = ast.parse(f.read(), filename=path)
+    except (SyntaxError, UnicodeDecodeError, ValueError):
+        return ()
+    defined = {node.name for node in tree.body if isinstance(node, ast.FunctionDef)}
+    return tuple(name for name in ENTRY_POINTS if name in defined)
+
+
+def discover(root: str = ROOT) -> dict[str, list[Variant]]:
+    """
+    Scan every ``dayN``/``YYYYdayN`` folder for scripts with solver entry points.
+
+    Args:
+        root (str): Repository root to scan.
+
+    Returns:
+        dict: Day folder name -> list of variants in natural (oldest to newest) order.
+    """
+    registry = {}
+    for day in sorted(os.listdir(root), key=natural_key):
+        day_dir = os.path.join(root, day)
+        if not DAY_DIR_PATTERN.match(day) or not os.path.isdir(day_dir):
+            continue
+        variants = []
+        for file_name in os.listdir(day_dir):
+            if not file_name.endswith(".py"):
+                continue
+            path = os.path.join(day_dir, file_name)
+            parts = _entry_points(path)
+            if parts:
+                variants.append(Variant(day, variant_name(file_name), path, parts))
+        if variants:
+            registry[day] = sorted(variants, key=lambda v: natural_key(v.name))
+    return registry
+
+
+def find_variant(registry: dict[str, list[Variant]], day, part: str = "part1", name: str = None) -> Variant:
+    """
+    Pick a variant of a day. Without a name, the newest numbered variant providing ``part``
+    wins; variants with non-numeric labels are only the default when nothing else provides it.
+
+    Raises:
+        KeyError: If the day, the variant or the requested part is not registered.
+    """
+    day = normalize_day(day)
+    if day not in registry:
+        raise KeyError(f"No registered solvers for {day}")
+    candidates = [v for v in registry[day] if part in v.parts]
+    if name is not None:
+        candidates = [v for v in candidates if v.name == name]
+    if not candidates:
+        label = f"variant {name} of {day}" if name else day
+        raise KeyError(f"No {label} provides {part}")
+    if name is None:
+        # Labels like "nore" are side experiments, not versions: prefer numbered variants
+        numbered = [v for v in candidates if v.name[:1].isdigit()]
+        candidates = numbered or candidates
+    return candidates[-1]
+
+
+def load_module(variant: Variant):
+    """
+    Import a variant's script once and reuse it for every later call.
+    File names like ``main1.9.py`` are not importable by name, so the module is built from its path.
+    It is also registered in ``sys.modules`` so its functions can be pickled for process pools.
+    """
+    module = _loaded_modules.get(variant.path)
+    if module is None:
+        module_name = "aoc_" + re.sub(r"\W", "_", f"{variant.day}_{variant.name}")
+        spec = importlib.util.spec_from_file_location(module_name, variant.path)
+        module = importlib.util.module_from_spec(spec)
+        sys.modules[module_name] = module
+        spec.loader.exec_module(module)
+        _loaded_modules[variant.path] = module
+    return module
+
+
+def get_solver(variant: Variant, part: str):
+    return getattr(load_module(variant), part)
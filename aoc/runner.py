@@ -0,0 +1,212 @@
+"""
+Single entry point for running any registered solver.
+
+Usage:
+    python -m aoc.runner --list
+    python -m aoc.runner 7                      # newest variant, both parts, input.txt
+    python -m aoc.runner 7 --part 2 --variant 1.9 --input input2.txt
+    python -m aoc.runner --all                  # every registered day in one process
+    python -m aoc.runner 20 --part 2 --counters --profile sample --profile-out day20.folded
+"""
+import argparse
+import os
+import sys
+from dataclasses import dataclass
+from time import perf_counter
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+from aoc import profiling
+from aoc.cache import ResultCache
+from aoc.registry import Variant, discover, find_variant, get_solver, normalize_day, natural_key
+
+
+@dataclass
+class RunResult:
+    day: str
+    variant: str
+    part: str
+    input_path: str
+    answer: object
+    seconds: float
+    peak_rss_mb: float | None
+    cached: bool = False
+    counters: dict = None
+    profile_report: str = None
+    error: str = None
+    process_peak: bool = False  # peak_rss_mb is the whole process's peak, not this run's
+
+
+def reset_peak_rss() -> bool:
+    """
+    Restart peak RSS tracking, so ``peak_rss_mb`` only covers what runs after this call.
+    Only Linux supports this (via ``/proc/self/clear_refs``); elsewhere the peak stays
+    that of the whole process and False is returned.
+    """
+    try:
+        with open("/proc/self/clear_refs", "w") as f:
+            f.write("5")
+        return True
+    except OSError:
+        return False
+
+
+def peak_rss_mb() -> float | None:
+    """
+    Peak resident set size in MB since the last ``reset_peak_rss`` or the process start
+    (None where unsupported).
+    """
+    try:
+        with open("/proc/self/status", "r") as f:
+            for line in f:
+                if line.startswith("VmHWM:"):
+                    return int(line.split()[1]) / 1024
+    except OSError:
+        pass
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports kilobytes, macOS reports bytes
+    return peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024
+
+
+def run(variant: Variant, part: str, input_path: str, cache: ResultCache = None,
+        profile: str = None, profile_out: str = None, counters: bool = False) -> RunResult:
+    """
+    Run one entry point of a variant on one input and time it.
+
+    Args:
+        variant (Variant): Registered solver script.
+        part (str): ``part1`` or ``part2``.
+        input_path (str): Input file, relative to the day folder or absolute.
+        cache (ResultCache): Answer cache to consult first; None always solves.
+        profile (str): ``cprofile`` or ``sample`` to run under a profiler (skips the cache).
+        profile_out (str): File for the collapsed-stack (flame graph) output.
+        counters (bool): Collect ``aoc.profiling`` counters during the run (skips the cache).
+
+    Returns:
+        RunResult: Answer, wall time and peak RSS of the run (of the whole process where
+        the peak cannot be reset, see ``reset_peak_rss``).
+    """
+    file_path = variant.input_path(input_path)
+    process_peak = not reset_peak_rss()
+    use_cache = cache is not None and cache.enabled and profile is None and not counters
+    start = perf_counter()
+    if use_cache:
+        key = cache.key(variant, part, file_path)
+        hit, answer = cache.get(key)
+        if hit:
+            return RunResult(variant.day, variant.name, part, file_path, answer,
+                             perf_counter() - start, peak_rss_mb(), cached=True, process_peak=process_peak)
+
+    solver = get_solver(variant, part)
+    report = None
+    if counters:
+        profiling.reset()
+        profiling.enable()
+    try:
+        start = perf_counter()
+        if profile is not None:
+            answer, report = profiling.profile_call(solver, file_path, mode=profile, output=profile_out)
+        else:
+            answer = solver(file_path)
+        elapsed = perf_counter() - start
+    finally:
+        profiling.disable()
+    if use_cache:
+        cache.put(key, answer, seconds=elapsed)
+    return RunResult(variant.day, variant.name, part, file_path, answer, elapsed, peak_rss_mb(),
+                     counters=dict(profiling.counters) if counters else None, profile_report=report,
+                     process_peak=process_peak)
+
+
+def format_result(result: RunResult) -> str:
+    rss = f"{result.peak_rss_mb:8.1f} MB" if result.peak_rss_mb is not None else "     n/a"
+    line = (f"{result.day:>10} {result.variant:>8} {result.part}  "
+            f"{result.seconds:9.4f}s {rss}  {result.answer}{'  (cached)' if result.cached else ''}"
+            f"{'  (peak of whole process)' if result.process_peak and result.peak_rss_mb is not None else ''}")
+    if result.counters is not None:
+        line += "\n" + " " * 12 + (profiling.format_counters(result.counters) or "no counters recorded")
+    if result.profile_report:
+        line += "\n" + result.profile_report
+    return line
+
+
+def parse_parts(part: str | None) -> list[str]:
+    if part is None:
+        return ["part1", "part2"]
+    return [part if part.startswith("part") else f"part{part}"]
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Run registered Advent of Code solvers.")
+    parser.add_argument("day", nargs="?", help="day number or folder name, e.g. 7 or 2023day21")
+    parser.add_argument("--part", help="1 or 2 (default: both)")
+    parser.add_argument("--variant", help="variant label, e.g. 1.9 for main1.9.py (default: newest)")
+    parser.add_argument("--input", default="input.txt", help="input file, relative to the day folder")
+    parser.add_argument("--all", action="store_true", help="run every registered day")
+    parser.add_argument("--no-cache", action="store_true", help="always solve, ignore and do not fill the answer cache")
+    parser.add_argument("--clear-cache", action="store_true", help="empty the answer cache and exit")
+    parser.add_argument("--list", action="store_true", help="list registered variants and exit")
+    parser.add_argument("--profile", choices=("cprofile", "sample"), help="run under a profiler")
+    parser.add_argument("--profile-out", help="collapsed-stack output for flame graphs, suffixed with the "
+                                              "day and part when several run (default: <day>_<variant>_<part>.folded)")
+    parser.add_argument("--counters", action="store_true", help="collect and print hot-path counters")
+    args = parser.parse_args(argv)
+
+    registry = discover()
+    cache = ResultCache(enabled=not args.no_cache)
+
+    if args.clear_cache:
+        cache.clear()
+        return 0
+
+    if args.list:
+        for day, variants in registry.items():
+            for v in variants:
+                print(f"{day:>10} {v.name:>8}  {', '.join(v.parts)}  {os.path.relpath(v.path)}")
+        return 0
+
+    if args.all:
+        days = list(registry)
+    elif args.day is not None:
+        days = [normalize_day(args.day)]
+    else:
+        parser.error("give a day, --all or --list")
+
+    missing = [day for day in days if day not in registry]
+    if missing:
+        print(f"No registered solvers for {', '.join(missing)}", file=sys.stderr)
+        return 1
+
+    parts = parse_parts(args.part)
+    for day in sorted(days, key=natural_key):
+        for part in parts:
+            try:
+                variant = find_variant(registry, day, part, args.variant)
+            except KeyError as e:
+                if args.all or args.part is None:
+                    continue
+                print(e.args[0], file=sys.stderr)
+                return 1
+            if args.all and not os.path.exists(variant.input_path(args.input)):
+                print(f"{day} {part}: skipped, no {args.input}", file=sys.stderr)
+                continue
+            profile_out = None
+            if args.profile:
+                profile_out = f"{day}_{variant.name}_{part}.folded"
+                if args.profile_out:
+                    # One file per run, so later runs do not overwrite earlier ones
+                    root, ext = os.path.splitext(args.profile_out)
+                    tags = ([day] if len(days) > 1 else []) + ([part] if len(parts) > 1 else [])
+                    profile_out = "_".join([root] + tags) + ext
+            print(format_result(run(variant, part, args.input, cache,
+                                    profile=args.profile, profile_out=profile_out, counters=args.counters)))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,249 @@
+"""
+Multi-pattern search over a ``uint8`` character grid (see ``aoc.grid``).
+
+Words are found in all 8 directions with one Aho-Corasick automaton holding every
+word and its reverse. The automaton is a dense ``(states, 256)`` transition table,
+so all lines of a family (rows, columns, or one of the two diagonal directions) advance
+together, one vectorized table lookup per step. Each family is swept once, whatever
+the number of words.
+
+Stencils are small 2-D shapes with wildcards, e.g. ``("M.S", ".A.", "M.S")``. They are
+matched in all 8 rotations/reflections by ANDing shifted equality masks. The mask of
+each letter is built once per band of rows and shared by every stencil cell that uses it.
+"""
+from collections import deque
+from dataclasses import dataclass
+
+import numpy as np
+
+SENTINEL = 0        # byte fed outside the grid on diagonal lines; never part of a word
+BAND_ROWS = 1024    # rows per band for stencil masks
+
+# (dr, dc) step of each line family; the reversed words cover the opposite directions
+LINE_FAMILIES = ((0, 1), (1, 0), (1, 1), (1, -1))
+
+
+@dataclass(frozen=True)
+class Match:
+    """
+    One occurrence of a pattern.
+
+    Attributes:
+        pattern (str): The word, or the stencil rows joined with newlines.
+        row (int): Row of the first letter (words) or of the top-left stencil cell.
+        col (int): Column of the first letter (words) or of the top-left stencil cell.
+        orientation: (dr, dc) reading direction for words; for stencils the index k
+            of the transform, ``rot90(stencil, k % 4)`` after a left-right flip if k >= 4.
+    """
+    pattern: str
+    row: int
+    col: int
+    orientation: object
+
+
+def build_automaton(patterns: list[bytes]) -> tuple[np.ndarray, list[list[int]]]:
+    """
+    Aho-Corasick automaton as a dense transition table.
+
+    Returns:
+        tuple: (table of shape (states, 256) where ``table[s, byte]`` is the next state,
+                outputs where ``outputs[s]`` lists the indices of patterns ending at state s)
+    """
+    children = [{}]
+    outputs = [[]]
+    for index, pattern in enumerate(patterns):
+        state = 0
+        for byte in pattern:
+            if byte not in children[state]:
+                children.append({})
+                outputs.append([])
+                children[state][byte] = len(children) - 1
+            state = children[state][byte]
+        outputs[state].append(index)
+
+    table = np.zeros((len(children), 256), dtype=np.int32)
+    fail = [0] * len(children)
+    queue = deque()
+    for byte, child in children[0].items():
+        table[0, byte] = child
+        queue.append(child)
+    while queue:
+        state = queue.popleft()
+        table[state] = table[fail[state]]
+        for byte, child in children[state].items():
+            fail[child] = int(table[fail[state], byte])
+            outputs[child] = outputs[child] + outputs[fail[child]]
+            table[state, byte] = child
+            queue.append(child)
+    return table, outputs
+
+
+def orientations(stencil: tuple[str, ...]) -> list[tuple[int, np.ndarray]]:
+    """
+    The distinct rotations/reflections of a stencil as (transform index, uint8 array) pairs.
+    """
+    base = np.array([list(row.encode("ascii")) for row in stencil], dtype=np.uint8)
+    seen = set()
+    result = []
+    for k in range(8):
+        shape = np.rot90(np.fliplr(base) if k >= 4 else base, k % 4)
+        key = (shape.shape, shape.tobytes())
+        if key not in seen:
+            seen.add(key)
+            result.append((k, np.ascontiguousarray(shape)))
+    return result
+
+
+def _line_bytes(grid: np.ndarray, family: tuple[int, int], p: int, out: np.ndarray) -> np.ndarray:
+    """
+    Bytes read by every line of a family at step ``p``.
+
+    Rows and columns are plain slices. Diagonal lines are numbered so that step ``p``
+    reads grid row ``p`` copied into ``out`` at an offset, and lines outside the grid
+    read ``SENTINEL``.
+    """
+    rows, cols = grid.shape
+    if family == (0, 1):
+        return grid[:, p]
+    if family == (1, 0):
+        return grid[p]
+    out.fill(SENTINEL)
+    offset = rows - 1 - p if family == (1, 1) else p
+    out[offset:offset + cols] = grid[p]
+    return out
+
+
+def _line_cell(shape: tuple[int, int], family: tuple[int, int], p: int, line: int) -> tuple[int, int]:
+    """
+    Grid cell (row, col) read by ``line`` of a family at step ``p`` (see ``_line_bytes``).
+    """
+    rows, _ = shape
+    if family == (0, 1):
+        return line, p
+    if family == (1, 0):
+        return p, line
+    if family == (1, 1):
+        return p, line - (rows - 1 - p)
+    return p, line - p
+
+
+class PatternSearch:
+    """
+    Count or locate several words and stencils in a grid in one sweep.
+
+    Every word is searched in all 8 directions; a palindrome is counted once per
+    direction it reads in, like the puzzle does. Every stencil is searched in all of
+    its distinct rotations and reflections. Stencil cells equal to ``wildcard`` match anything.
+
+    Args:
+        words (iterable): Words to find.
+        stencils (iterable): Stencils, each a sequence of equal-length strings or one
+            newline-separated string.
+        wildcard (str): Stencil character that matches any cell.
+    """
+
+    def __init__(self, words=(), stencils=(), wildcard="."):
+        self.words = list(dict.fromkeys(words))
+        if "" in self.words:
+            raise ValueError("Words must not be empty")
+        self.stencils = {}
+        for stencil in stencils:
+            rows = tuple(stencil.split("\n") if isinstance(stencil, str) else stencil)
+            if len({len(row) for row in rows}) != 1:
+                raise ValueError(f"Stencil rows must have equal length: {rows!r}")
+            if "\n".join(rows) in self.words:
+                raise ValueError(f"Stencil {rows!r} has the same key as a word; search it as a word")
+            self.stencils["\n".join(rows)] = orientations(rows)
+        self.wildcard = ord(wildcard)
+
+        # Entry 2i is word i, entry 2i + 1 is word i reversed
+        entries = [w.encode("ascii")[::step] for w in self.words for step in (1, -1)]
+        self._table, self._outputs = build_automaton(entries) if entries else (None, None)
+        if entries:
+            hits = np.zeros((len(self._outputs), len(self.words)), dtype=np.int64)
+            for state, ends in enumerate(self._outputs):
+                for entry in ends:
+                    hits[state, entry // 2] += 1
+            self._hits = hits
+
+    def _sweep_words(self, grid: np.ndarray, locate: bool):
+        """
+        Run the automaton along every line family. Yields per-state visit counts, or matches.
+        """
+        rows, cols = grid.shape
+        lengths = [len(w) for w in self.words]
+        terminal = np.array([bool(ends) for ends in self._outputs])
+        table = self._table.ravel()
+        diagonal = np.empty(rows + cols - 1, dtype=np.uint8)
+        for family in LINE_FAMILIES:
+            dr, dc = family
+            steps = cols if family == (0, 1) else rows
+            lines = {(0, 1): rows, (1, 0): cols}.get(family, diagonal.size)
+            state = np.zeros(lines, dtype=np.int32)
+            visits = np.zeros(len(self._outputs), dtype=np.int64)
+            for p in range(steps):
+                state = table[state * 256 + _line_bytes(grid, family, p, diagonal)]
+                if not locate:
+                    visits += np.bincount(state, minlength=visits.size)
+                    continue
+                for line in np.flatnonzero(terminal[state]):
+                    r, c = _line_cell(grid.shape, family, p, int(line))
+                    for entry in self._outputs[state[line]]:
+                        word = entry // 2
+                        if entry % 2:  # reversed word: reads backwards from this cell
+                            yield Match(self.words[word], r, c, (-dr, -dc))
+                        else:
+                            span = lengths[word] - 1
+                            yield Match(self.words[word], r - span * dr, c - span * dc, (dr, dc))
+            if not locate:
+                yield visits
+
+    def _sweep_stencils(self, grid: np.ndarray, band_rows: int = BAND_ROWS):
+        """
+        Yield (pattern, transform, hit mask, first row of the band) for every band of rows.
+        """
+        shapes = [(key, k, shape) for key, variants in self.stencils.items() for k, shape in variants]
+        overlap = max(shape.shape[0] for _, _, shape in shapes) - 1
+        letters = {int(b) for _, _, shape in shapes for b in np.unique(shape)} - {self.wildcard}
+        for start in range(0, grid.shape[0], band_rows):
+            keep = min(band_rows, grid.shape[0] - start)
+            sub = grid[start:start + keep + overlap]
+            masks = {letter: sub == letter for letter in letters}
+            for key, k, shape in shapes:
+                h, w = shape.shape
+                height = min(sub.shape[0] - h + 1, keep)
+                width = sub.shape[1] - w + 1
+                if height <= 0 or width <= 0:
+                    continue
+                hit = np.ones((height, width), dtype=bool)
+                for (dy, dx), letter in np.ndenumerate(shape):
+                    if letter != self.wildcard:
+                        hit &= masks[int(letter)][dy:dy + height, dx:dx + width]
+                yield key, k, hit, start
+
+    def count(self, grid: np.ndarray) -> dict[str, int]:
+        """
+        Number of matches of every word and stencil, keyed like ``Match.pattern``.
+        """
+        counts = dict.fromkeys(self.words, 0)
+        counts.update(dict.fromkeys(self.stencils, 0))
+        if self.words and grid.size:
+            visits = sum(self._sweep_words(grid, locate=False))
+            for word, n in zip(self.words, visits @ self._hits):
+                counts[word] += int(n)
+        if self.stencils and grid.size:
+            for key, _, hit, _ in self._sweep_stencils(grid):
+                counts[key] += int(np.count_nonzero(hit))
+        return counts
+
+    def locate(self, grid: np.ndarray) -> list[Match]:
+        """
+        Every match, words first (in sweep order), then stencils (in row-major order per band).
+        """
+        matches = []
+        if self.words and grid.size:
+            matches.extend(self._sweep_words(grid, locate=True))
+        if self.stencils and grid.size:
+            for key, k, hit, start in self._sweep_stencils(grid):
+                matches.extend(Match(key, int(r) + start, int(c), k) for r, c in np.argwhere(hit))
+        return matches
@@ -0,0 +1,78 @@
+import os
+import sys
+from time import perf_counter
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from aoc.numbers import CHUNK_BYTES, iter_number_chunks, split_pairs
+
+
+def read_columns(file_path: str, chunk_bytes: int = CHUNK_BYTES) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Read both location lists in one pass over the file.
+
+    The file is parsed in chunks of ``chunk_bytes`` by NumPy in C (see
+    ``aoc.numbers``), so no Python object is created per number.
+
+    Args:
+        file_path (str): Path to the input file.
+        chunk_bytes (int): Bytes of text parsed at once; bounds the temporary memory.
+
+    Returns:
+        tuple: (left, right) as ``int64`` arrays.
+    """
+    pieces = list(iter_number_chunks(file_path, chunk_bytes))
+    values = np.concatenate(pieces) if pieces else np.zeros(0, dtype=np.int64)
+    return split_pairs(values, file_path)
+
+
+def total_distance(left: np.ndarray, right: np.ndarray) -> int:
+    """
+    Part one: pair the lists up smallest to smallest and add the distances.
+    """
+    return int(np.abs(np.sort(left) - np.sort(right)).sum())
+
+
+def similarity_score(left: np.ndarray, right: np.ndarray) -> int:
+    """
+    Part two: every left number times how often it appears in the right list.
+
+    The right list is reduced to (value, count) with ``np.unique`` and every left
+    number finds its count with one ``searchsorted``, instead of a dict lookup per number.
+    """
+    values, counts = np.unique(right, return_counts=True)
+    if values.size == 0:
+        return 0
+    idx = np.searchsorted(values, left)
+    idx[idx == values.size] = 0
+    found = values[idx] == left
+    return int((left[found] * counts[idx[found]]).sum())
+
+
+def part1(file_path: str) -> int:
+    return total_distance(*read_columns(file_path))
+
+
+def part2(file_path: str) -> int:
+    return similarity_score(*read_columns(file_path))
+
+
+def main():
+    directory = os.path.dirname(os.path.abspath(__file__))
+    file_path = os.path.join(directory, 'input.txt')
+
+    start = perf_counter()
+    left, right = read_columns(file_path)
+    parsed = perf_counter()
+    distance = total_distance(left, right)
+    score = similarity_score(left, right)
+    end = perf_counter()
+
+    print(f"Total distance: {distance}")
+    print(f"Total Similarity Score: {score}")
+    print(f"Elapsed Time (parse): {parsed - start:0.4f}s, (solve): {end - parsed:0.4f}s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,186 @@
+import os
+import sys
+import tempfile
+from time import perf_counter
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from aoc.numbers import iter_number_chunks, split_pairs
+
+CHUNK_BYTES = 1 << 26   # text parsed per sorted run (~4.5M lines of a real-format input)
+MERGE_BLOCK = 1 << 16   # values read from each run per merge step
+
+
+def iter_chunks(file_path: str, chunk_bytes: int = CHUNK_BYTES):
+    """
+    Yield (left, right) ``int64`` arrays for consecutive pieces of the file, cut at line ends.
+    """
+    for values in iter_number_chunks(file_path, chunk_bytes):
+        yield split_pairs(values, file_path)
+
+
+def spill_sorted_runs(file_path: str, workdir: str, chunk_bytes: int = CHUNK_BYTES) -> tuple:
+    """
+    External sort, phase one: sort each chunk of both columns and append it to a
+    per-column run file.
+
+    Returns:
+        tuple: (left memmap, right memmap, runs) where runs is a list of (start, end)
+               offsets, the same for both columns. The memmaps are None for an empty input.
+    """
+    runs = []
+    total = 0
+    left_path = os.path.join(workdir, "left.bin")
+    right_path = os.path.join(workdir, "right.bin")
+    with open(left_path, "wb") as left_file, open(right_path, "wb") as right_file:
+        for left, right in iter_chunks(file_path, chunk_bytes):
+            np.sort(left).tofile(left_file)
+            np.sort(right).tofile(right_file)
+            runs.append((total, total + left.size))
+            total += left.size
+    if total == 0:
+        return None, None, runs
+    return (np.memmap(left_path, dtype=np.int64, mode="r"),
+            np.memmap(right_path, dtype=np.int64, mode="r"), runs)
+
+
+def merge_runs(data: np.ndarray, runs: list[tuple[int, int]], block: int = MERGE_BLOCK):
+    """
+    External sort, phase two: k-way merge of sorted runs, yielding sorted blocks.
+
+    Each run is read ``block`` values at a time. Everything up to the smallest "last
+    buffered value" over all runs is final, since later data in every run is at least
+    that large, so it is sorted and emitted in one vectorized step.
+    """
+    cursors = [start for start, _ in runs]
+    ends = [end for _, end in runs]
+    buffers = [data[0:0]] * len(runs)
+    while True:
+        for i in range(len(runs)):
+            if buffers[i].size == 0 and cursors[i] < ends[i]:
+                stop = min(cursors[i] + block, ends[i])
+                buffers[i] = np.array(data[cursors[i]:stop])
+                cursors[i] = stop
+        live = [i for i in range(len(runs)) if buffers[i].size]
+        if not live:
+            return
+        cutoff = min(buffers[i][-1] for i in live)
+        taken = []
+        for i in live:
+            k = np.searchsorted(buffers[i], cutoff, side="right")
+            taken.append(buffers[i][:k])
+            buffers[i] = buffers[i][k:]
+        yield np.sort(np.concatenate(taken))
+
+
+def run_lengths(blocks):
+    """
+    Turn a stream of sorted blocks into (values, counts) blocks with every value exactly once,
+    holding back each block's last value in case it continues in the next block.
+    """
+    carry_value = carry_count = None
+    for block in blocks:
+        values, counts = np.unique(block, return_counts=True)
+        if carry_value is not None:
+            if values[0] == carry_value:
+                counts[0] += carry_count
+            else:
+                values = np.concatenate(([carry_value], values))
+                counts = np.concatenate(([carry_count], counts))
+        carry_value, carry_count = values[-1], counts[-1]
+        if values.size > 1:
+            yield values[:-1], counts[:-1]
+    if carry_value is not None:
+        yield np.array([carry_value]), np.array([carry_count])
+
+
+def streaming_distance(left_blocks, right_blocks) -> int:
+    """
+    Part one: walk both sorted streams in lockstep and add up the pairwise distances.
+    """
+    total = 0
+    left = right = np.zeros(0, dtype=np.int64)
+    while True:
+        if left.size == 0:
+            left = next(left_blocks, None)
+        if right.size == 0:
+            right = next(right_blocks, None)
+        if left is None or right is None:
+            return total
+        n = min(left.size, right.size)
+        total += int(np.abs(left[:n] - right[:n]).sum())
+        left, right = left[n:], right[n:]
+
+
+def streaming_similarity(left_blocks, right_blocks) -> int:
+    """
+    Part two: merge-join of the two sorted streams. Every value present in both lists
+    adds value * (count in left) * (count in right).
+    """
+    left_runs, right_runs = run_lengths(left_blocks), run_lengths(right_blocks)
+    total = 0
+    lv = lc = rv = rc = np.zeros(0, dtype=np.int64)
+    while True:
+        if lv.size == 0:
+            lv, lc = next(left_runs, (None, None))
+        if rv.size == 0:
+            rv, rc = next(right_runs, (None, None))
+        if lv is None or rv is None:
+            return total
+        cutoff = min(lv[-1], rv[-1])
+        lk = np.searchsorted(lv, cutoff, side="right")
+        rk = np.searchsorted(rv, cutoff, side="right")
+        common, li, ri = np.intersect1d(lv[:lk], rv[:rk], assume_unique=True, return_indices=True)
+        total += int((common * lc[li] * rc[ri]).sum())
+        lv, lc, rv, rc = lv[lk:], lc[lk:], rv[rk:], rc[rk:]
+
+
+def solve_out_of_core(file_path: str, workdir: str = None, chunk_bytes: int = CHUNK_BYTES,
+                      block: int = MERGE_BLOCK) -> tuple[int, int]:
+    """
+    Both parts with memory bounded by ``chunk_bytes`` while spilling and by
+    (number of runs x ``block``) while merging, whatever the size of the input.
+
+    Args:
+        file_path (str): Path to the input file.
+        workdir (str): Directory for the run files (default: system temp dir).
+        chunk_bytes (int): Text per sorted run.
+        block (int): Values read per run per merge step.
+
+    Returns:
+        tuple: (total distance, similarity score)
+    """
+    with tempfile.TemporaryDirectory(dir=workdir) as tmp:
+        left, right, runs = spill_sorted_runs(file_path, tmp, chunk_bytes)
+        if not runs:
+            return 0, 0
+        distance = streaming_distance(merge_runs(left, runs, block), merge_runs(right, runs, block))
+        score = streaming_similarity(merge_runs(left, runs, block), merge_runs(right, runs, block))
+        del left, right  # release the maps before the directory is removed (needed on Windows)
+    return distance, score
+
+
+def part1(file_path: str) -> int:
+    return solve_out_of_core(file_path)[0]
+
+
+def part2(file_path: str) -> int:
+    return solve_out_of_core(file_path)[1]
+
+
+def main():
+    directory = os.path.dirname(os.path.abspath(__file__))
+    file_path = os.path.join(directory, 'input.txt')
+
+    start = perf_counter()
+    distance, score = solve_out_of_core(file_path)
+    end = perf_counter()
+
+    print(f"Total distance: {distance}")
+    print(f"Total Similarity Score: {score}")
+    print(f"Elapsed Time: {end - start:0.4f}s")
+
+
+if __name__ == "__main__":
+    main()
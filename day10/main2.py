@@ -57,6 +57,9 @@ def solve(lines):
     
     return total_score
 
+def part2(file_path):
+    return solve(read_grid(file_path))
+
 def main():
     directory = os.path.dirname(__file__)+'\\'
     file_path = directory+'input.txt'
@@ -1,6 +1,8 @@
 import sys
 import os
 sys.setrecursionlimit(10**7)
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from aoc import profiling
 
 def make_step(num):
     # Rule 1: If stone is 0 -> becomes stone with number 1
@@ -26,10 +28,23 @@ def step_through(stones, blinks):
             if new_num is not None:
                 new_stones.append(new_num)
         stones = new_stones
-        print(f"blink {i}, {len(stones)} stones")
+        if profiling.active:
+            profiling.counters["blinks"] += 1
+            profiling.counters["stones_processed"] += len(stones)
     return stones
 
 
+def read_stones(file_path):
+    with open(file_path, 'r') as f:
+        return [int(num) for num in f.read().split()]
+
+
+def part1(file_path):
+    # Brute force keeps every stone in a list; 75 blinks are left to the count-based main7.py
+    return len(step_through(read_stones(file_path), 25))
+
+
+
 def main():
     directory = os.path.dirname(__file__) + '\\'
     # Example input
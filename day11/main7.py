@@ -1,6 +1,8 @@
 import sys
 import os
 sys.setrecursionlimit(10**7)
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from aoc import profiling
 
 def make_step(num):
     # Rule 1: If stone is 0 -> becomes stone with number 1
@@ -52,6 +54,9 @@ def smart_evolve_no_collections(stones, blinks):
         
         # Move to next iteration
         counts = new_counts
+        if profiling.active:
+            profiling.counters["blinks"] += 1
+            profiling.counters["distinct_stones"] += len(counts)
 
     # After all blinks, sum up counts
     total_stones = 0
@@ -59,6 +64,16 @@ def smart_evolve_no_collections(stones, blinks):
         total_stones += c
     return total_stones
 
+def read_stones(file_path):
+    with open(file_path, 'r') as f:
+        return [int(num) for num in f.read().split()]
+
+def part1(file_path):
+    return smart_evolve_no_collections(read_stones(file_path), 25)
+
+def part2(file_path):
+    return smart_evolve_no_collections(read_stones(file_path), 75)
+
 def main():
     directory = os.path.dirname(__file__) + '\\'
     # Example input
@@ -1,6 +1,9 @@
 import os
+import sys
 import heapq
 import pprint as pp
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from aoc import profiling
 
 def read_input(file_path):
     """Reads the input and parses it into a list of (x, y) coordinates."""
@@ -25,6 +28,8 @@ def is_path_blocked(grid, start_pos, end_pos):
 
     while heap:
         cost, (x, y) = heapq.heappop(heap)
+        if profiling.active:
+            profiling.counters["heap_pops"] += 1
 
         # If we reached the end position
         if (x, y) == end_pos:
@@ -40,6 +45,8 @@ def is_path_blocked(grid, start_pos, end_pos):
             nx, ny = x + dx, y + dy
             if 0 <= nx < width and 0 <= ny < height and grid[ny][nx] != '#':
                 heapq.heappush(heap, (cost + 1, (nx, ny)))
+                if profiling.active:
+                    profiling.counters["heap_pushes"] += 1
 
     # If no path found
     return True  # Path is blocked
@@ -51,7 +58,8 @@ def find_blocking_byte(coords, width, height):
     end_pos = (width, height)
 
     for i, (x, y) in enumerate(coords):
-        print("iteration", i, x, y)
+        if profiling.active:
+            profiling.counters["path_checks"] += 1
         # Add the next byte to the grid
         grid[y][x] = '#'
 
@@ -62,6 +70,15 @@ def find_blocking_byte(coords, width, height):
     # If no blocking byte found
     return None
 
+def memory_size(coords):
+    """Width and height of the memory space: the exit corner is the largest coordinate on each axis."""
+    return max(x for x, _ in coords), max(y for _, y in coords)
+
+def part2(file_path):
+    coords = read_input(file_path)
+    blocking_byte = find_blocking_byte(coords, *memory_size(coords)) if coords else None
+    return f"{blocking_byte[0]},{blocking_byte[1]}" if blocking_byte else None
+
 def main():
     """Main function to execute the solution."""
     # Define the input file path
@@ -0,0 +1,138 @@
+import os
+from time import perf_counter
+
+import numpy as np
+
+DIRECTIONS = (1, -1)
+
+
+def read_reports(file_path):
+    with open(file_path, 'r') as file:
+        return [list(map(int, line.split())) for line in file if line.strip()]
+
+
+def is_good_step(diff, direction):
+    return 1 <= diff * direction <= 3
+
+
+def first_bad_step(report, direction, skip=-1):
+    """
+    Index of the first level whose step to the next level is bad, ignoring level ``skip``.
+    Returns None if every step is good. Runs in O(len(report)) without copying the report.
+    """
+    prev = None
+    for i, level in enumerate(report):
+        if i == skip:
+            continue
+        if prev is not None and not is_good_step(level - report[prev], direction):
+            return prev
+        prev = i
+    return None
+
+
+def is_report_safe(report):
+    return any(first_bad_step(report, d) is None for d in DIRECTIONS)
+
+
+def is_safe_with_dampener(report):
+    """
+    Safe after removing at most one level, in linear time.
+
+    For a fixed direction, if the first bad step is between levels f and f+1, removing
+    any level before f or after f+1 leaves that step in place. So only f and f+1 are
+    worth trying: at most four O(n) scans instead of n re-checks of a copied report.
+    """
+    for direction in DIRECTIONS:
+        f = first_bad_step(report, direction)
+        if f is None:
+            return True
+        if any(first_bad_step(report, direction, skip=j) is None for j in (f, f + 1)):
+            return True
+    return False
+
+
+def read_reports_csr(file_path):
+    """
+    All reports as one flat ``int64`` array plus offsets; report i is values[offsets[i]:offsets[i + 1]].
+    """
+    with open(file_path, 'rb') as f:
+        lines = [line.split() for line in f if line.strip()]
+    lengths = np.fromiter((len(line) for line in lines), dtype=np.int64, count=len(lines))
+    values = np.fromiter((int(x) for line in lines for x in line), dtype=np.int64, count=int(lengths.sum()))
+    offsets = np.zeros(len(lines) + 1, dtype=np.int64)
+    np.cumsum(lengths, out=offsets[1:])
+    return values, offsets
+
+
+def count_safe_with_dampener_batch(values, offsets):
+    """
+    Batch version of ``is_safe_with_dampener`` for every report at once.
+
+    Per direction: one vectorized pass flags bad steps, ``np.minimum.reduceat`` finds the
+    first bad step f of every report, and the two candidate removals f and f+1 are checked
+    with prefix counts of bad steps plus the single step that bridges the removed level.
+
+    Returns:
+        tuple: (safe without dampener, safe with dampener) as boolean arrays.
+    """
+    n = values.size
+    if n == 0:
+        return np.zeros(0, dtype=bool), np.zeros(0, dtype=bool)
+    lengths = np.diff(offsets)
+    starts, lasts = offsets[:-1], offsets[1:] - 1
+    is_last = np.zeros(n, dtype=bool)
+    is_last[lasts] = True
+    steps = np.append(np.diff(values), 0)
+
+    safe = np.zeros(lengths.size, dtype=bool)
+    dampened = np.zeros(lengths.size, dtype=bool)
+    for direction in DIRECTIONS:
+        good = (steps * direction >= 1) & (steps * direction <= 3)
+        bad = ~good & ~is_last
+        prefix = np.zeros(n + 1, dtype=np.int64)
+        np.cumsum(bad, out=prefix[1:])
+
+        first_bad = np.minimum.reduceat(np.where(bad, np.arange(n), n), starts)
+        clean = first_bad == n
+        safe |= clean
+        dampened |= clean
+
+        for offset in (0, 1):
+            j = np.minimum(first_bad + offset, lasts)      # level to remove
+            before_ok = prefix[np.maximum(j - 1, starts)] == prefix[starts]   # steps s .. j-2
+            after_ok = prefix[lasts] == prefix[np.minimum(j + 1, lasts)]      # steps j+1 .. last-1
+            interior = (j > starts) & (j < lasts)
+            bridge = (values[np.minimum(j + 1, n - 1)] - values[np.maximum(j - 1, 0)]) * direction
+            bridge_ok = ~interior | ((bridge >= 1) & (bridge <= 3))
+            dampened |= ~clean & before_ok & after_ok & bridge_ok
+    return safe, dampened
+
+
+def part1(file_path):
+    return sum(is_report_safe(report) for report in read_reports(file_path))
+
+
+def part2(file_path):
+    _, dampened = count_safe_with_dampener_batch(*read_reports_csr(file_path))
+    return int(dampened.sum())
+
+
+def main():
+    directory = os.path.dirname(os.path.abspath(__file__))
+    file_path = os.path.join(directory, 'input.txt')
+
+    reports = read_reports(file_path)
+    start = perf_counter()
+    total_safe_with_dampener = sum(is_safe_with_dampener(report) for report in reports)
+    scalar_end = perf_counter()
+    safe, dampened = count_safe_with_dampener_batch(*read_reports_csr(file_path))
+    batch_end = perf_counter()
+
+    print(f"Number of safe reports without Dampener: {int(safe.sum())}")
+    print(f"Number of safe reports with Dampener: {total_safe_with_dampener}")
+    print(f"Number of safe reports with Dampener (batch): {int(dampened.sum())}")
+    print(f"Elapsed Time (scalar): {scalar_end - start:0.4f}s, (batch): {batch_end - scalar_end:0.4f}s")
+
+
+if __name__ == "__main__":
+    main()
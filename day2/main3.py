@@ -0,0 +1,124 @@
+import os
+from time import perf_counter
+
+import numpy as np
+
+
+def read_reports_csr(file_path: str) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Read every report into one flat array plus offsets (CSR layout).
+
+    Report ``i`` is ``values[offsets[i]:offsets[i + 1]]``. Numbers are parsed in one
+    ``np.fromstring`` call; the per-line lengths come from counting token starts per
+    line on the raw bytes, so there is no Python loop over lines. Empty lines are skipped.
+
+    Args:
+        file_path (str): Path to the input file.
+
+    Returns:
+        tuple: (values as ``int64``, offsets of length reports + 1)
+    """
+    with open(file_path, "rb") as f:
+        data = f.read()
+    values = np.fromstring(data.decode("ascii"), dtype=np.int64, sep=" ")
+
+    buf = np.frombuffer(data, dtype=np.uint8)
+    is_token = (buf != ord(" ")) & (buf != ord("\n")) & (buf != ord("\r")) & (buf != ord("\t"))
+    starts = is_token.copy()
+    starts[1:] &= ~is_token[:-1]
+    line_of_byte = np.cumsum(buf == ord("\n")) - (buf == ord("\n"))
+    lengths = np.bincount(line_of_byte[starts])
+    lengths = lengths[lengths > 0]
+    if lengths.sum() != values.size:
+        raise ValueError(f"{file_path}: could not parse every level as an integer")
+
+    offsets = np.zeros(lengths.size + 1, dtype=np.int64)
+    np.cumsum(lengths, out=offsets[1:])
+    return values, offsets
+
+
+def bad_diff_prefix(values: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Prefix counts of bad differences over the flat array, one for increasing and one for decreasing.
+
+    ``prefix[b] - prefix[a]`` is the number of bad differences ``values[k + 1] - values[k]``
+    for ``a <= k < b``. Differences across report boundaries are never inside a queried range.
+    """
+    diffs = np.diff(values)
+    bad_inc = ~((diffs >= 1) & (diffs <= 3))
+    bad_dec = ~((diffs <= -1) & (diffs >= -3))
+    prefix_inc = np.zeros(values.size, dtype=np.int64)
+    prefix_dec = np.zeros(values.size, dtype=np.int64)
+    np.cumsum(bad_inc, out=prefix_inc[1:])
+    np.cumsum(bad_dec, out=prefix_dec[1:])
+    return prefix_inc, prefix_dec
+
+
+def safe_mask(values: np.ndarray, offsets: np.ndarray) -> np.ndarray:
+    """
+    Part one for every report at once: no bad difference in one of the two directions.
+    """
+    if values.size == 0:
+        return np.zeros(0, dtype=bool)
+    prefix_inc, prefix_dec = bad_diff_prefix(values)
+    start, last = offsets[:-1], offsets[1:] - 1
+    return (prefix_inc[last] == prefix_inc[start]) | (prefix_dec[last] == prefix_dec[start])
+
+
+def dampened_safe_mask(values: np.ndarray, offsets: np.ndarray) -> np.ndarray:
+    """
+    Part two for every report at once: safe after removing at most one level.
+
+    For every level ``k`` of a report spanning ``[s, e)``, removing it leaves the
+    differences before ``k - 1``, the differences after ``k``, and one bridging
+    difference ``values[k + 1] - values[k - 1]``. The first two come from the prefix
+    counts, the bridge is one vectorized subtraction, so all removals of all reports
+    are tested in O(total levels) with no per-report Python work.
+    """
+    n = values.size
+    if n == 0:
+        return np.zeros(0, dtype=bool)
+    prefix_inc, prefix_dec = bad_diff_prefix(values)
+    lengths = np.diff(offsets)
+    report = np.repeat(np.arange(lengths.size), lengths)
+    k = np.arange(n)
+    s = offsets[:-1][report]
+    last = offsets[1:][report] - 1
+
+    before_hi = np.maximum(s, k - 1)       # differences s .. k-2
+    after_lo = np.minimum(k + 1, last)     # differences k+1 .. last-1
+    interior = (k > s) & (k < last)
+    bridge = values[np.minimum(k + 1, n - 1)] - values[np.maximum(k - 1, 0)]
+
+    ok_inc = ((prefix_inc[before_hi] == prefix_inc[s]) & (prefix_inc[last] == prefix_inc[after_lo])
+              & (~interior | ((bridge >= 1) & (bridge <= 3))))
+    ok_dec = ((prefix_dec[before_hi] == prefix_dec[s]) & (prefix_dec[last] == prefix_dec[after_lo])
+              & (~interior | ((bridge <= -1) & (bridge >= -3))))
+    return np.logical_or.reduceat(ok_inc | ok_dec, offsets[:-1]) | safe_mask(values, offsets)
+
+
+def part1(file_path: str) -> int:
+    return int(safe_mask(*read_reports_csr(file_path)).sum())
+
+
+def part2(file_path: str) -> int:
+    return int(dampened_safe_mask(*read_reports_csr(file_path)).sum())
+
+
+def main():
+    directory = os.path.dirname(os.path.abspath(__file__))
+    file_path = os.path.join(directory, 'input.txt')
+
+    start = perf_counter()
+    values, offsets = read_reports_csr(file_path)
+    safe = safe_mask(values, offsets)
+    dampened = dampened_safe_mask(values, offsets)
+    end = perf_counter()
+
+    print(f"Number of safe reports without Dampener: {int(safe.sum())}")
+    print(f"Number of safe reports with Dampener: {int(dampened.sum())}")
+    print(f"Elapsed Time: {end - start:0.4f}s")
+
+
+if __name__ == "__main__":
+    main()
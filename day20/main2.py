@@ -1,6 +1,9 @@
 from collections import deque, defaultdict
 import math
+import os
 import sys
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from aoc import profiling
 
 def read_grid(file_path):
     grid = []
@@ -21,13 +24,11 @@ def bfs_no_cheat(grid, start):
     dist[start[0]][start[1]] = 0
     q = deque([start])
     directions = [(0,1),(1,0),(0,-1),(-1,0)]
-    visited_count = 0
     while q:
         x,y = q.popleft()
         d = dist[x][y]
-        visited_count += 1
-        if visited_count % 100000 == 0:
-            print(f"BFS from {start}: visited {visited_count} cells")
+        if profiling.active:
+            profiling.counters["bfs_visits"] += 1
         for dx,dy in directions:
             nx, ny = x+dx, y+dy
             if 0 <= nx < width and 0 <= ny < height:
@@ -59,12 +60,10 @@ def find_cheats(grid, distFromStart, distFromEnd, distWithoutCheat, max_cheat=20
         q = deque([(sx,sy,0)])
         visited.add((sx,sy,0))
 
-        expansions = 0
         while q:
             x,y,steps = q.popleft()
-            expansions += 1
-            if expansions % 100000 == 0:
-                print(f"Cheat BFS from ({sx},{sy}) processed {expansions} states")
+            if profiling.active:
+                profiling.counters["cheat_bfs_expansions"] += 1
 
             # If we're on track (not starting cell with steps=0) and steps>0, we can end cheat
             # grid[ny][nx] in ('.','E') means track
@@ -106,8 +105,15 @@ def find_cheats(grid, distFromStart, distFromEnd, distWithoutCheat, max_cheat=20
     count_min_savings = sum(1 for v in cheat_scenarios.values() if v>=min_savings)
     return cheat_scenarios, count_min_savings
 
+def part2(file_path):
+    grid, start, end = read_grid(file_path)
+    distFromStart = bfs_no_cheat(grid, start)
+    distFromEnd = bfs_no_cheat(grid, end)
+    distWithoutCheat = distFromStart[end[0]][end[1]]
+    _, count_100 = find_cheats(grid, distFromStart, distFromEnd, distWithoutCheat, max_cheat=20, min_savings=100)
+    return count_100
+
 def main():
-    import os
     """Main function to execute the solution."""
     # Define the input file path
     directory = os.path.dirname(os.path.abspath(__file__))
@@ -1,13 +1,9 @@
 import numpy as np
 import os
 
-directory = os.path.dirname(__file__)+'\\'
-file_path = directory+'input.txt'
-print(file_path)
-
 import re
 
-def calculate_mul_sum(input_string):
+def calculate_mul_sum(input_string, verbose=True):
     # Define the regex pattern
     pattern = r'mul\((\d{1,3}),(\d{1,3})\)'
 
@@ -22,18 +18,16 @@ def calculate_mul_sum(input_string):
         y = int(y_str)
         product = x * y
         total_sum += product
-        print(f"mul({x},{y}) = {product}")
+        if verbose:
+            print(f"mul({x},{y}) = {product}")
 
-    print(f"\nTotal Sum: {total_sum}")
+    if verbose:
+        print(f"\nTotal Sum: {total_sum}")
     return total_sum
 
 # Example usage with your sample input
 input_string = "[why()what()]:!*<)~mul(929,350)({)when()@mul(878,389)}$!? mul(786,950)~when();[(#mul(808,160)mul(659,500)&+?*mul(659,863)~~&:;,>do()(%@from()^!how()how()'@mul(281,23)"
-with open(file_path, 'r') as file:
-    input_string = file.read()
-
 
-calculate_mul_sum(input_string)
 
 def calculate_do_dont(input_string):
     # Define the regex pattern
@@ -59,4 +53,17 @@ def calculate_do_dont(input_string):
     print(f"\nTotal Sum: {total_sum}")
     return total_sum
 
-#calculate_do_dont(input_string)
\ No newline at end of file
+#calculate_do_dont(input_string)
+
+
+def part1(file_path):
+    with open(file_path, 'r') as file:
+        return calculate_mul_sum(file.read(), verbose=False)
+
+
+if __name__ == "__main__":
+    file_path = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'input.txt')
+    print(file_path)
+    with open(file_path, 'r') as file:
+        input_string = file.read()
+    calculate_mul_sum(input_string)
@@ -0,0 +1,104 @@
+import os
+import re
+from time import perf_counter
+
+TOKEN = re.compile(rb"mul\((\d{1,3}),(\d{1,3})\)|(do\(\))|(don't\(\))")
+MAX_TOKEN = len(b"mul(999,999)")
+CHUNK_BYTES = 1 << 20
+
+
+class StreamingScanner:
+    """
+    Scans corrupted memory chunk by chunk and keeps both sums as it goes.
+
+    A token can be split across two chunks, so the last ``MAX_TOKEN - 1`` bytes of
+    every chunk (that are not part of an accepted token) are carried over and scanned
+    again with the next chunk. The do()/don't() state is carried the same way, which
+    makes the result identical to scanning the whole file at once.
+
+    Args:
+        verbose (bool): Print every mul/do/don't as it is found.
+    """
+
+    def __init__(self, verbose=False):
+        self.verbose = verbose
+        self.enabled = True
+        self.total = 0          # part one: every mul
+        self.enabled_total = 0  # part two: mul while enabled
+        self._carry = b""
+
+    def _scan(self, buf, limit):
+        """
+        Handle tokens starting before ``limit``; return where the unconsumed tail starts.
+        """
+        consumed = 0
+        for match in TOKEN.finditer(buf):
+            if match.start() >= limit:
+                break
+            consumed = match.end()
+            x, y, do, dont = match.groups()
+            if do:
+                self.enabled = True
+                if self.verbose:
+                    print("do() encountered: mul instructions enabled")
+            elif dont:
+                self.enabled = False
+                if self.verbose:
+                    print("don't() encountered: mul instructions disabled")
+            else:
+                product = int(x) * int(y)
+                self.total += product
+                if self.enabled:
+                    self.enabled_total += product
+                if self.verbose:
+                    print(f"mul({int(x)},{int(y)}) = {product} ({'Enabled' if self.enabled else 'Disabled'})")
+        return max(consumed, limit)
+
+    def feed(self, chunk):
+        buf = self._carry + chunk
+        limit = max(0, len(buf) - (MAX_TOKEN - 1))
+        self._carry = buf[self._scan(buf, limit):]
+
+    def finish(self):
+        self._scan(self._carry, len(self._carry))
+        self._carry = b""
+        return self.total, self.enabled_total
+
+
+def scan_file(file_path, chunk_bytes=CHUNK_BYTES, verbose=False):
+    """
+    Both sums in one pass over the file, with memory bounded by ``chunk_bytes``.
+
+    Returns:
+        tuple: (sum of all mul, sum of enabled mul)
+    """
+    scanner = StreamingScanner(verbose)
+    with open(file_path, 'rb') as f:
+        for chunk in iter(lambda: f.read(chunk_bytes), b""):
+            scanner.feed(chunk)
+    return scanner.finish()
+
+
+def part1(file_path):
+    return scan_file(file_path)[0]
+
+
+def part2(file_path):
+    return scan_file(file_path)[1]
+
+
+def main():
+    directory = os.path.dirname(os.path.abspath(__file__))
+    file_path = os.path.join(directory, 'input.txt')
+
+    start = perf_counter()
+    total, enabled_total = scan_file(file_path)
+    end = perf_counter()
+
+    print(f"Total Sum: {total}")
+    print(f"Total Sum (do/don't): {enabled_total}")
+    print(f"Elapsed Time: {end - start:0.4f}s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,108 @@
+import mmap
+import os
+import re
+from concurrent.futures import ProcessPoolExecutor
+from time import perf_counter
+
+TOKEN = re.compile(rb"mul\((\d{1,3}),(\d{1,3})\)|(do\(\))|(don't\(\))")
+MAX_TOKEN = len(b"mul(999,999)")
+MIN_PARALLEL_BYTES = 1 << 22  # below this the pool costs more than it saves
+
+
+def scan_segment(file_path, start, end):
+    """
+    Summarize the tokens that start in ``[start, end)`` of the file.
+
+    The segment does not know whether mul is enabled when it begins, so it is scanned
+    once while tracking both cases. After its first do()/don't() the two cases agree.
+    No token can begin inside another token, so scanning from an arbitrary offset finds
+    exactly the tokens the sequential scanner would; the read runs ``MAX_TOKEN - 1``
+    bytes past ``end`` to complete a token that starts just before it.
+
+    Returns:
+        tuple: (sum of all mul,
+                sum of enabled mul if the segment starts enabled,
+                sum of enabled mul if the segment starts disabled,
+                state after the segment: True/False, or None if it has no do()/don't())
+    """
+    with open(file_path, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as data:
+        buf = data[start:min(len(data), end + MAX_TOKEN - 1)]
+    limit = end - start
+    total = if_enabled = if_disabled = 0
+    enabled_a, enabled_b = True, False
+    exit_state = None
+    for match in TOKEN.finditer(buf):
+        if match.start() >= limit:
+            break
+        x, y, do, dont = match.groups()
+        if do or dont:
+            exit_state = enabled_a = enabled_b = bool(do)
+        else:
+            product = int(x) * int(y)
+            total += product
+            if enabled_a:
+                if_enabled += product
+            if enabled_b:
+                if_disabled += product
+    return total, if_enabled, if_disabled, exit_state
+
+
+def combine(summaries):
+    """
+    Fold segment summaries in file order, starting enabled.
+
+    Returns:
+        tuple: (sum of all mul, sum of enabled mul)
+    """
+    enabled = True
+    total = enabled_total = 0
+    for seg_total, if_enabled, if_disabled, exit_state in summaries:
+        total += seg_total
+        enabled_total += if_enabled if enabled else if_disabled
+        if exit_state is not None:
+            enabled = exit_state
+    return total, enabled_total
+
+
+def scan_parallel(file_path, workers=None, segments_per_worker=4):
+    """
+    Both sums, with the file split into segments that are scanned in worker processes.
+    Every worker maps the file itself, so only offsets and four numbers cross process boundaries.
+    """
+    size = os.path.getsize(file_path)
+    if size == 0:
+        return 0, 0
+    workers = workers or os.cpu_count() or 1
+    if workers == 1 or size < MIN_PARALLEL_BYTES:
+        return combine([scan_segment(file_path, 0, size)])
+
+    count = workers * segments_per_worker
+    bounds = [size * i // count for i in range(count + 1)]
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        summaries = pool.map(scan_segment, [file_path] * count, bounds[:-1], bounds[1:])
+        return combine(summaries)
+
+
+def part1(file_path):
+    return scan_parallel(file_path)[0]
+
+
+def part2(file_path):
+    return scan_parallel(file_path)[1]
+
+
+def main():
+    directory = os.path.dirname(os.path.abspath(__file__))
+    file_path = os.path.join(directory, 'input.txt')
+
+    start = perf_counter()
+    total, enabled_total = scan_parallel(file_path)
+    end = perf_counter()
+
+    print(f"Total Sum: {total}")
+    print(f"Total Sum (do/don't): {enabled_total}")
+    print(f"Elapsed Time: {end - start:0.4f}s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,94 @@
+import mmap
+import os
+from time import perf_counter
+
+MUL = b"mul("
+DO = b"do()"
+DONT = b"don't()"
+
+
+def parse_args(window):
+    """
+    Parse the ``X,Y)`` that must follow ``mul(``: 1-3 digits, a comma, 1-3 digits.
+    ``window`` is the (at most 8) bytes after ``mul(``, enough for the longest valid arguments.
+
+    Returns:
+        int: X * Y, or None if the window does not start with valid arguments.
+    """
+    close = window.find(b")")
+    if close < 3:
+        return None
+    x, comma, y = window[:close].partition(b",")
+    if comma and 0 < len(x) <= 3 and 0 < len(y) <= 3 and x.isdigit() and y.isdigit():
+        return int(x) * int(y)
+    return None
+
+
+def tokenize(data):
+    """
+    Both sums over ``bytes`` (or an mmap/memoryview-backed buffer), without regex.
+
+    Instead of stepping byte by byte, ``bytes.find`` jumps straight to the next
+    ``mul(`` and the next ``do``; only those few positions are parsed by hand. The
+    grammar is the same as the regex variants: 1-3 digits, a comma, 1-3 digits, ``)``.
+    A token can never begin inside another token, so a failed ``mul(`` only skips its
+    own four bytes.
+
+    Returns:
+        tuple: (sum of all mul, sum of enabled mul)
+    """
+    total = enabled_total = 0
+    enabled = True
+    next_mul = data.find(MUL)
+    next_do = data.find(b"do")
+    while next_mul != -1:
+        # Apply every do()/don't() before the next mul(.
+        while next_do != -1 and next_do < next_mul:
+            if data[next_do:next_do + 4] == DO:
+                enabled = True
+            elif data[next_do:next_do + 7] == DONT:
+                enabled = False
+            next_do = data.find(b"do", next_do + 2)
+
+        product = parse_args(data[next_mul + 4:next_mul + 12])
+        if product is not None:
+            total += product
+            if enabled:
+                enabled_total += product
+        next_mul = data.find(MUL, next_mul + 4)
+    return total, enabled_total
+
+
+def scan_file(file_path):
+    """
+    Tokenize the file through a read-only memory map, so it is never copied into a Python object.
+    """
+    if os.path.getsize(file_path) == 0:
+        return 0, 0
+    with open(file_path, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as data:
+        return tokenize(data)
+
+
+def part1(file_path):
+    return scan_file(file_path)[0]
+
+
+def part2(file_path):
+    return scan_file(file_path)[1]
+
+
+def main():
+    directory = os.path.dirname(os.path.abspath(__file__))
+    file_path = os.path.join(directory, 'input.txt')
+
+    start = perf_counter()
+    total, enabled_total = scan_file(file_path)
+    end = perf_counter()
+
+    print(f"Total Sum: {total}")
+    print(f"Total Sum (do/don't): {enabled_total}")
+    print(f"Elapsed Time: {end - start:0.4f}s")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,11 +1,7 @@
 import numpy as np
 import os
 
-directory = os.path.dirname(__file__)+'\\'
-file_path = directory+'input.txt'
-print(file_path)
-
-def calculate_mul_sum_without_regex(input_string):
+def calculate_mul_sum_without_regex(input_string, verbose=True):
     total_sum = 0
     is_enabled = True
     i = 0
@@ -15,19 +11,21 @@ def calculate_mul_sum_without_regex(input_string):
         # Check for 'do()'
         if input_string[i:i+4] == 'do()':
             is_enabled = True
-            print("do() encountered: mul instructions enabled")
+            if verbose:
+                print("do() encountered: mul instructions enabled")
             i += 4
         # Check for "don't()"
         elif input_string[i:i+7] == "don't()":
             is_enabled = False
-            print("don't() encountered: mul instructions disabled")
+            if verbose:
+                print("don't() encountered: mul instructions disabled")
             i += 7
         # Check for 'mul('
         elif input_string[i:i+4] == 'mul(':
             i += 4  # Move past 'mul('
-            # Extract first number
+            # Extract first number (1-3 digits, like the puzzle's mul(X,Y))
             num1 = ''
-            while i < length and input_string[i].isdigit():
+            while i < length and input_string[i].isdigit() and len(num1) < 3:
                 num1 += input_string[i]
                 i += 1
             # Check for ','
@@ -37,7 +35,7 @@ def calculate_mul_sum_without_regex(input_string):
                 continue  # Invalid format, skip
             # Extract second number
             num2 = ''
-            while i < length and input_string[i].isdigit():
+            while i < length and input_string[i].isdigit() and len(num2) < 3:
                 num2 += input_string[i]
                 i += 1
             # Check for ')'
@@ -52,17 +50,30 @@ def calculate_mul_sum_without_regex(input_string):
                 product = x * y
                 if is_enabled:
                     total_sum += product
-                    print(f"mul({x},{y}) = {product} (Enabled)")
+                    if verbose:
+                        print(f"mul({x},{y}) = {product} (Enabled)")
                 else:
-                    print(f"mul({x},{y}) = {product} (Disabled)")
+                    if verbose:
+                        print(f"mul({x},{y}) = {product} (Disabled)")
         else:
             i += 1  # Move to the next character
     
-    print(f"\nTotal Sum: {total_sum}")
+    if verbose:
+        print(f"\nTotal Sum: {total_sum}")
     return total_sum
 
 # Example usage
 input_string = "xmul(2,4)&mul[3,7]!^don't()_mul(5,5)+mul(32,64](mul(11,8)undo()?mul(8,5))"
-with open(file_path, 'r') as file:
-    input_string = file.read()
-calculate_mul_sum_without_regex(input_string)
+
+
+def part2(file_path):
+    with open(file_path, 'r') as file:
+        return calculate_mul_sum_without_regex(file.read(), verbose=False)
+
+
+if __name__ == "__main__":
+    file_path = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'input.txt')
+    print(file_path)
+    with open(file_path, 'r') as file:
+        input_string = file.read()
+    calculate_mul_sum_without_regex(input_string)
@@ -0,0 +1,103 @@
+import os
+import sys
+from time import perf_counter
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from aoc.grid import load_grid
+
+# Half of the 8 directions; the other half is the same line read backwards
+FORWARD_DIRECTIONS = ((0, 1), (1, 1), (1, 0), (1, -1))
+BAND_ROWS = 1024  # rows per band, so large grids never need full-size masks
+
+
+def iter_bands(grid, overlap, band_rows=BAND_ROWS):
+    """
+    Yield (sub_grid, n) where the first ``n`` rows of ``sub_grid`` are this band's own rows
+    and the remaining ``overlap`` rows (when present) belong to the next band.
+    """
+    rows = grid.shape[0]
+    for start in range(0, rows, band_rows):
+        n = min(band_rows, rows - start)
+        yield grid[start:start + n + overlap], n
+
+
+def count_in_direction(grid, word, dr, dc, keep_rows):
+    """
+    Count starts of ``word`` read along (dr, dc) with dr >= 0, counting only starts in the
+    first ``keep_rows`` rows. One AND of shifted equality masks per letter.
+    """
+    rows, cols = grid.shape
+    span = len(word) - 1
+    height = rows - span * dr
+    col_lo = max(0, -span * dc)
+    col_hi = cols - max(0, span * dc)
+    if height <= 0 or col_hi <= col_lo:
+        return 0
+    height = min(height, keep_rows)
+    found = None
+    for k, letter in enumerate(word.encode("ascii")):
+        r, c = k * dr, k * dc
+        match = grid[r:r + height, col_lo + c:col_hi + c] == letter
+        found = match if found is None else np.logical_and(found, match, out=found)
+    return int(np.count_nonzero(found))
+
+
+def count_word(grid, word="XMAS"):
+    """
+    Part one: occurrences of ``word`` in all 8 directions, as shifted boolean masks.
+    The 4 backward directions are the forward ones searched for the reversed word.
+    """
+    total = 0
+    for sub, keep_rows in iter_bands(grid, overlap=len(word) - 1):
+        for target in (word, word[::-1]):
+            for dr, dc in FORWARD_DIRECTIONS:
+                total += count_in_direction(sub, target, dr, dc, keep_rows)
+    return total
+
+
+def count_x_mas(grid):
+    """
+    Part two: every A whose two diagonals each read MAS in either direction.
+    """
+    m, a, s = (ord(ch) for ch in "MAS")
+    total = 0
+    for sub, keep_rows in iter_bands(grid, overlap=2):
+        if sub.shape[0] < 3 or sub.shape[1] < 3:
+            continue
+        height = min(sub.shape[0] - 2, keep_rows)
+        ul, ur = sub[:height, :-2], sub[:height, 2:]
+        dl, dr = sub[2:height + 2, :-2], sub[2:height + 2, 2:]
+        center = sub[1:height + 1, 1:-1] == a
+        center &= ((ul == m) & (dr == s)) | ((ul == s) & (dr == m))
+        center &= ((ur == m) & (dl == s)) | ((ur == s) & (dl == m))
+        total += int(np.count_nonzero(center))
+    return total
+
+
+def part1(file_path):
+    return count_word(load_grid(file_path))
+
+
+def part2(file_path):
+    return count_x_mas(load_grid(file_path))
+
+
+def main():
+    directory = os.path.dirname(os.path.abspath(__file__))
+    file_path = os.path.join(directory, 'input.txt')
+
+    start = perf_counter()
+    grid = load_grid(file_path)
+    total_xmas = count_word(grid)
+    total_x_mas = count_x_mas(grid)
+    end = perf_counter()
+
+    print(f"The word 'XMAS' appears {total_xmas} times in the word search.")
+    print(f"The X-MAS pattern appears {total_x_mas} times in the word search.")
+    print(f"Elapsed Time: {end - start:0.4f}s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,49 @@
+import os
+import sys
+from time import perf_counter
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from aoc.grid import load_grid
+from aoc.search import PatternSearch
+
+WORD = "XMAS"
+X_MAS = ("M.S",
+         ".A.",
+         "M.S")
+
+
+def search(file_path):
+    """
+    Both parts from one engine run: the word in all 8 directions and the X-shaped
+    stencil in all of its rotations.
+
+    Returns:
+        tuple: (XMAS count, X-MAS count)
+    """
+    counts = PatternSearch(words=[WORD], stencils=[X_MAS]).count(load_grid(file_path))
+    return counts[WORD], counts["\n".join(X_MAS)]
+
+
+def part1(file_path):
+    return PatternSearch(words=[WORD]).count(load_grid(file_path))[WORD]
+
+
+def part2(file_path):
+    return PatternSearch(stencils=[X_MAS]).count(load_grid(file_path))["\n".join(X_MAS)]
+
+
+def main():
+    directory = os.path.dirname(os.path.abspath(__file__))
+    file_path = os.path.join(directory, 'input.txt')
+
+    start = perf_counter()
+    total_xmas, total_x_mas = search(file_path)
+    end = perf_counter()
+
+    print(f"The word 'XMAS' appears {total_xmas} times in the word search.")
+    print(f"The X-MAS pattern appears {total_x_mas} times in the word search.")
+    print(f"Elapsed Time: {end - start:0.4f}s")
+
+
+if __name__ == "__main__":
+    main()
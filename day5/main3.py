@@ -0,0 +1,123 @@
+import os
+from functools import cmp_to_key
+from time import perf_counter
+
+
+def parse_input(file_path):
+    """
+    Returns:
+        tuple: (rules as (x, y) pairs meaning x must come before y, updates as lists of pages)
+    """
+    rules = []
+    updates = []
+    with open(file_path, 'r') as f:
+        for line in f:
+            line = line.strip()
+            if '|' in line:
+                x, y = line.split('|')
+                rules.append((int(x), int(y)))
+            elif line:
+                updates.append([int(num) for num in line.split(',') if num.strip()])
+    return rules, updates
+
+
+def build_precedence_index(rules):
+    """
+    Compile the rules once into one bitset per page: bit y of ``index[x]`` is set when x must
+    come before y. Any lookup afterwards is O(1), whatever the number of rules.
+    """
+    index = {}
+    for x, y in rules:
+        index[x] = index.get(x, 0) | (1 << y)
+    return index
+
+
+def must_precede(index, x, y):
+    return index.get(x, 0) >> y & 1
+
+
+def is_correctly_ordered(update, index):
+    """
+    O(k) check of the k - 1 consecutive pairs.
+
+    The puzzle's rules cover every pair of pages that share an update, so they order each
+    update totally, and an update is correct exactly when every neighbour pair is.
+    """
+    return all(must_precede(index, a, b) for a, b in zip(update, update[1:]))
+
+
+def reorder(update, index):
+    """
+    The update sorted by a comparator that reads the precedence index.
+    """
+    def compare(a, b):
+        if must_precede(index, a, b):
+            return -1
+        if must_precede(index, b, a):
+            return 1
+        return 0
+    return sorted(update, key=cmp_to_key(compare))
+
+
+def get_middle_page_number(update):
+    return update[len(update) // 2]
+
+
+def middle_page(update, index):
+    """
+    Middle page of the correctly ordered update, without ordering it.
+
+    In the sorted update the middle page has ``len(update) // 2`` pages before it and
+    ``len(update) - 1 - len(update) // 2`` after it. Its in-update successors are one
+    AND of its bitset with the update's page mask, so one counting pass over the
+    update finds it.
+    """
+    mask = 0
+    for page in update:
+        mask |= 1 << page
+    after = len(update) - 1 - len(update) // 2
+    for page in update:
+        if (index.get(page, 0) & mask).bit_count() == after:
+            return page
+    raise ValueError(f"Rules do not order update {update}")
+
+
+def solve(file_path):
+    """
+    Returns:
+        tuple: (middle-page sum of correct updates, middle-page sum of incorrect updates once reordered)
+    """
+    rules, updates = parse_input(file_path)
+    index = build_precedence_index(rules)
+    correct = incorrect = 0
+    for update in updates:
+        if is_correctly_ordered(update, index):
+            correct += get_middle_page_number(update)
+        else:
+            incorrect += middle_page(update, index)
+    return correct, incorrect
+
+
+def part1(file_path):
+    return solve(file_path)[0]
+
+
+def part2(file_path):
+    return solve(file_path)[1]
+
+
+def main():
+    directory = os.path.dirname(os.path.abspath(__file__))
+    file_path = os.path.join(directory, 'input.txt')
+
+    start = perf_counter()
+    correct, incorrect = solve(file_path)
+    end = perf_counter()
+
+    print(f"Sum of middle page numbers of correctly ordered updates: {correct}")
+    print(f"Sum of middle page numbers after correcting updates: {incorrect}")
+    print(f"Elapsed Time: {end - start:0.4f}s")
+
+
+if __name__ == "__main__":
+    main()
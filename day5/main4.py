@@ -0,0 +1,133 @@
+import os
+from time import perf_counter
+
+import numpy as np
+
+PAD = -1  # indexes the extra last row/column of the precedence matrix, which is all False
+CHUNK_UPDATES = 1 << 14  # updates per block when selecting middle pages
+
+
+def read_batch(file_path: str) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Parse the whole file without a Python loop over lines.
+
+    Returns:
+        tuple: (rules as an (r, 2) array of (before, after) pages,
+                updates as an ``int16`` matrix padded with ``PAD``,
+                length of every update)
+    """
+    with open(file_path, "rb") as f:
+        data = f.read().replace(b"\r\n", b"\n")
+    head, _, tail = data.strip().partition(b"\n\n")
+    if b"|" not in head:  # no rules section
+        head, tail = b"", head
+    rules = np.fromstring(head.replace(b"|", b" ").decode("ascii"), dtype=np.int64, sep=" ").reshape(-1, 2)
+
+    lines = tail.strip()
+    if not lines:
+        return rules, np.zeros((0, 0), dtype=np.int16), np.zeros(0, dtype=np.int64)
+    values = np.fromstring(lines.replace(b",", b" ").decode("ascii"), dtype=np.int16, sep=" ")
+    raw = np.frombuffer(lines, dtype=np.uint8)
+    lengths = np.bincount(np.cumsum(raw == ord("\n"))[raw == ord(",")],
+                          minlength=lines.count(b"\n") + 1) + 1
+    if lengths.sum() != values.size:
+        raise ValueError(f"{file_path}: could not parse every page number")
+
+    offsets = np.zeros(lengths.size, dtype=np.int64)
+    np.cumsum(lengths[:-1], out=offsets[1:])
+    rows = np.repeat(np.arange(lengths.size), lengths)
+    cols = np.arange(values.size) - offsets[rows]
+    updates = np.full((lengths.size, lengths.max()), PAD, dtype=np.int16)
+    updates[rows, cols] = values
+    return rules, updates, lengths
+
+
+def precedence_matrix(rules: np.ndarray, size: int = 100) -> np.ndarray:
+    """
+    ``must[x, y]`` is True when page x must come before page y (100 x 100 for two-digit pages),
+    plus one empty row and column that ``PAD`` entries look up.
+    """
+    must = np.zeros((size + 1, size + 1), dtype=bool)
+    must[rules[:, 0], rules[:, 1]] = True
+    return must
+
+
+def validate(updates: np.ndarray, lengths: np.ndarray, must: np.ndarray) -> np.ndarray:
+    """
+    Every update at once: one fancy-index lookup of all consecutive pairs. The rules order
+    every pair of pages in an update, so checking neighbours is enough.
+    """
+    before = updates[:, :-1].astype(np.intp)
+    after = updates[:, 1:].astype(np.intp)
+    in_update = np.arange(updates.shape[1] - 1) < (lengths - 1)[:, None]
+    return np.all(must[before, after] | ~in_update, axis=1)
+
+
+def middle_pages(updates: np.ndarray, lengths: np.ndarray) -> np.ndarray:
+    return updates[np.arange(lengths.size), lengths // 2].astype(np.int64)
+
+
+def reordered_middle_pages(updates: np.ndarray, lengths: np.ndarray, must: np.ndarray) -> np.ndarray:
+    """
+    Middle page of every update once correctly ordered, without sorting anything: the page
+    with ``len - 1 - len // 2`` in-update successors.
+
+    In-update successors are the page's row of ``must`` dotted with the update's one-hot
+    page set, for all pages of all updates in one ``einsum``. Updates are handled
+    ``CHUNK_UPDATES`` at a time to bound memory.
+    """
+    result = np.zeros(lengths.size, dtype=np.int64)
+    width = updates.shape[1]
+    must_counts = must.astype(np.uint8)
+    for start in range(0, lengths.size, CHUNK_UPDATES):
+        block = updates[start:start + CHUNK_UPDATES].astype(np.intp)
+        n = lengths[start:start + CHUNK_UPDATES]
+        valid = np.arange(width) < n[:, None]
+        present = np.zeros((n.size, must.shape[0]), dtype=np.uint8)
+        present[np.arange(n.size)[:, None], block] = 1   # PAD marks the empty last page
+        successors = np.einsum("ijk,ik->ij", must_counts[block], present)
+        is_middle = (successors == (n - 1 - n // 2)[:, None]) & valid
+        if not is_middle.any(axis=1).all():
+            raise ValueError("Rules do not order every update")
+        result[start:start + n.size] = block[np.arange(n.size), is_middle.argmax(axis=1)]
+    return result
+
+
+def solve(file_path: str) -> tuple[int, int]:
+    """
+    Returns:
+        tuple: (middle-page sum of correct updates, middle-page sum of incorrect updates once reordered)
+    """
+    rules, updates, lengths = read_batch(file_path)
+    if lengths.size == 0:
+        return 0, 0
+    must = precedence_matrix(rules, max(100, int(rules.max(initial=0)) + 1, int(updates.max()) + 1))
+    correct = validate(updates, lengths, must)
+    part_one = int(middle_pages(updates[correct], lengths[correct]).sum())
+    part_two = int(reordered_middle_pages(updates[~correct], lengths[~correct], must).sum())
+    return part_one, part_two
+
+
+def part1(file_path: str) -> int:
+    return solve(file_path)[0]
+
+
+def part2(file_path: str) -> int:
+    return solve(file_path)[1]
+
+
+def main():
+    directory = os.path.dirname(os.path.abspath(__file__))
+    file_path = os.path.join(directory, 'input.txt')
+
+    start = perf_counter()
+    correct, incorrect = solve(file_path)
+    end = perf_counter()
+
+    print(f"Sum of middle page numbers of correctly ordered updates: {correct}")
+    print(f"Sum of middle page numbers after correcting updates: {incorrect}")
+    print(f"Elapsed Time: {end - start:0.4f}s")
+
+
+if __name__ == "__main__":
+    main()
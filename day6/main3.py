@@ -0,0 +1,278 @@
+import mmap
+import os
+import sys
+import tempfile
+from concurrent.futures import ProcessPoolExecutor
+from time import perf_counter
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from aoc.grid import DIRECTIONS, NEIGHBORS4, load_grid
+
+OBSTACLE = ord("#")
+STEPS = [(int(dr), int(dc)) for dr, dc in NEIGHBORS4]
+MIN_PARALLEL_CANDIDATES = 20000  # below this the pool costs more than it saves
+CHUNKS_PER_WORKER = 8
+
+_worker_jump = None   # per-process views of the shared jump table, attached by _init_worker
+_worker_width = None
+
+
+def find_guard(grid):
+    """
+    Returns:
+        tuple: (flat index of the guard, direction index into ``NEIGHBORS4``)
+    """
+    for marker, direction in DIRECTIONS.items():
+        flat = np.flatnonzero(grid == ord(marker))
+        if flat.size:
+            return int(flat[0]), direction
+    raise ValueError("Guard not found in the map")
+
+
+def _stops_up(blocked):
+    """
+    Row where a guard walking up from each cell stops (just below the nearest ``#`` above),
+    or -1 where nothing is above and it walks off the map.
+    """
+    rows = np.arange(blocked.shape[0])[:, None]
+    last = np.maximum.accumulate(np.where(blocked, rows, -1), axis=0)
+    above = np.vstack([np.full((1, blocked.shape[1]), -1), last[:-1]])
+    return np.where(above >= 0, above + 1, -1)
+
+
+def build_jump_table(grid):
+    """
+    For each direction (up, right, down, left) and each cell, the flat index of the cell
+    where the guard stops before the next ``#``. When the guard would walk off the map the
+    entry is ``~edge``, i.e. negative, with ``edge`` the last cell inside the map.
+
+    Returns:
+        np.ndarray: ``int32`` array of shape (4, rows * cols).
+    """
+    blocked = grid == OBSTACLE
+    rows, cols = blocked.shape
+    r = np.arange(rows)[:, None]
+    c = np.arange(cols)[None, :]
+
+    up = _stops_up(blocked)
+    down = _stops_up(blocked[::-1])[::-1]
+    down = np.where(down >= 0, rows - 1 - down, -1)
+    left = _stops_up(blocked.T).T
+    right = _stops_up(blocked.T[::-1])[::-1].T
+    right = np.where(right >= 0, cols - 1 - right, -1)
+
+    table = np.empty((4, rows * cols), dtype=np.int32)
+    for d, (stop, edge, is_vertical) in enumerate(((up, 0, True), (right, cols - 1, False),
+                                                   (down, rows - 1, True), (left, 0, False))):
+        target = np.where(stop >= 0, stop, edge)
+        flat = target * cols + c if is_vertical else r * cols + target
+        table[d] = np.where(stop >= 0, flat, ~flat).ravel()
+    return table
+
+
+def jump_lookup(table):
+    """
+    One ``memoryview`` per direction over a jump table (array or raw ``int32`` buffer).
+    Indexing a memoryview returns a Python int and is as fast as indexing a list, without
+    a Python object per entry.
+    """
+    flat = memoryview(table).cast("B").cast("i")
+    cells = len(flat) // 4
+    return [flat[d * cells:(d + 1) * cells] for d in range(4)]
+
+
+def next_stop(jump, width, pos, direction, obstacle=-1):
+    """
+    Where the guard stops when leaving ``pos`` in ``direction``, taking one extra
+    obstruction into account (see ``build_jump_table`` for the encoding).
+    """
+    stop = jump[direction][pos]
+    if obstacle < 0:
+        return stop
+    pr, pc = divmod(pos, width)
+    orow, ocol = divmod(obstacle, width)
+    sr, sc = divmod(stop if stop >= 0 else ~stop, width)
+    dr, dc = STEPS[direction]
+    # The obstruction matters only if it lies on the segment from pos to the stop (or edge)
+    if dc == 0 and ocol == pc and min(pr, sr) <= orow <= max(pr, sr) and orow != pr:
+        return obstacle - dr * width
+    if dr == 0 and orow == pr and min(pc, sc) <= ocol <= max(pc, sc) and ocol != pc:
+        return obstacle - dc
+    return stop
+
+
+class VisitedStates:
+    """
+    Set of guard states ``cell * 4 + direction`` for one simulation at a time, reusable
+    across simulations.
+
+    Each slot of a ``bytearray`` holds the generation that last visited it. Starting a new
+    simulation only bumps the generation, so nothing is cleared or reallocated, except a
+    full wipe every 255 generations when the counter wraps. At one byte per state, this
+    is far smaller than a set of tuples.
+    """
+
+    def __init__(self, cells):
+        self.stamps = bytearray(cells * 4)
+        self.generation = 0
+
+    def new_generation(self):
+        self.generation += 1
+        if self.generation == 256:
+            self.stamps[:] = bytes(len(self.stamps))
+            self.generation = 1
+        return self.generation
+
+
+def is_loop(jump, width, start, direction, obstacle=-1, visited=None):
+    """
+    Walk from turning point to turning point. The guard loops exactly when it turns at
+    the same cell in the same direction twice, so only turn states are remembered.
+    """
+    if visited is None:
+        visited = VisitedStates(len(jump[0]))
+    stamps = visited.stamps
+    generation = visited.new_generation()
+    pos = start
+    while True:
+        pos = next_stop(jump, width, pos, direction, obstacle)
+        if pos < 0:
+            return False
+        direction = (direction + 1) & 3
+        state = pos * 4 + direction
+        if stamps[state] == generation:
+            return True
+        stamps[state] = generation
+
+
+def visited_cells(grid, jump, start, direction):
+    """
+    Part one: mark every cell between consecutive turning points, one slice per segment.
+    """
+    rows, width = grid.shape
+    visited = np.zeros((rows, width), dtype=bool)
+    turns = set()
+    pos = start
+    while True:
+        stop = next_stop(jump, width, pos, direction)
+        end = stop if stop >= 0 else ~stop
+        (r0, c0), (r1, c1) = divmod(pos, width), divmod(end, width)
+        visited[min(r0, r1):max(r0, r1) + 1, min(c0, c1):max(c0, c1) + 1] = True
+        if stop < 0:
+            return int(visited.sum())
+        pos, direction = stop, (direction + 1) & 3
+        if pos * 4 + direction in turns:
+            raise ValueError("The guard never leaves the map")
+        turns.add(pos * 4 + direction)
+
+
+def route_candidates(jump, width, start, direction):
+    """
+    The unobstructed route as obstruction candidates: only a cell the guard walks through
+    can change its path. For each cell, in the order the guard first enters it, also
+    return the state just before: the previous cell and the direction of travel.
+    The path up to that point does not touch the cell, so a simulation can start there.
+
+    Returns:
+        list: (cell, previous cell, direction) tuples, the start cell excluded.
+    """
+    seen = {start}
+    turns = set()
+    candidates = []
+    pos = start
+    while True:
+        stop = next_stop(jump, width, pos, direction)
+        end = stop if stop >= 0 else ~stop
+        dr, dc = STEPS[direction]
+        step = dr * width + dc
+        for cell in range(pos + step, end + step, step):
+            if cell not in seen:
+                seen.add(cell)
+                candidates.append((cell, cell - step, direction))
+        if stop < 0:
+            return candidates
+        pos, direction = stop, (direction + 1) & 3
+        if pos * 4 + direction in turns:
+            raise ValueError("The guard never leaves the map")
+        turns.add(pos * 4 + direction)
+
+
+def count_loops(jump, width, candidates):
+    visited = VisitedStates(len(jump[0]))
+    return sum(is_loop(jump, width, prev, direction, cell, visited) for cell, prev, direction in candidates)
+
+
+def _init_worker(table_path, width):
+    """
+    Every worker maps the jump table file the parent wrote, read-only, so all processes
+    share the same pages instead of each holding its own copy.
+    """
+    global _worker_jump, _worker_width
+    with open(table_path, "rb") as f:
+        mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    _worker_jump = jump_lookup(mapped)  # the views keep the mapping alive
+    _worker_width = width
+
+
+def _count_chunk(candidates):
+    return count_loops(_worker_jump, _worker_width, candidates)
+
+
+def sweep_obstructions(file_path, workers=None):
+    """
+    Part two: number of cells where one new obstruction traps the guard in a loop.
+    Candidates are the route cells only, each simulated from just before the cell;
+    large sweeps are split into chunks over worker processes, which share one jump
+    table through a memory-mapped temporary file.
+    """
+    grid = load_grid(file_path)
+    start, direction = find_guard(grid)
+    table = build_jump_table(grid)
+    jump = jump_lookup(table)
+    width = grid.shape[1]
+    candidates = route_candidates(jump, width, start, direction)
+
+    workers = workers or os.cpu_count() or 1
+    if workers == 1 or len(candidates) < MIN_PARALLEL_CANDIDATES:
+        return count_loops(jump, width, candidates)
+    size = -(-len(candidates) // (workers * CHUNKS_PER_WORKER))
+    chunks = [candidates[i:i + size] for i in range(0, len(candidates), size)]
+    with tempfile.TemporaryDirectory() as tmp:
+        table_path = os.path.join(tmp, "jump.bin")
+        table.tofile(table_path)
+        with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker,
+                                 initargs=(table_path, width)) as pool:
+            return sum(pool.map(_count_chunk, chunks))
+
+
+def part1(file_path):
+    grid = load_grid(file_path)
+    start, direction = find_guard(grid)
+    return visited_cells(grid, jump_lookup(build_jump_table(grid)), start, direction)
+
+
+def part2(file_path):
+    return sweep_obstructions(file_path)
+
+
+def main():
+    directory = os.path.dirname(os.path.abspath(__file__))
+    file_path = os.path.join(directory, 'input.txt')
+
+    start_time = perf_counter()
+    grid = load_grid(file_path)
+    start, direction = find_guard(grid)
+    jump = jump_lookup(build_jump_table(grid))
+    visited = visited_cells(grid, jump, start, direction)
+    loops = sweep_obstructions(file_path)
+    end_time = perf_counter()
+
+    print(f"Distinct positions visited: {visited}")
+    print(f"Obstruction positions that cause a loop: {loops}")
+    print(f"Elapsed Time: {end_time - start_time:0.4f}s")
+
+
+if __name__ == "__main__":
+    main()
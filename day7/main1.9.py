@@ -59,6 +59,14 @@ def solve_equations(equations: list[tuple[int, list[int]]], operators: tuple[str
     return total
 
 
+def part1(file_path: str) -> int:
+    return solve_equations(parse_input(file_path), operators=("+", "*"))
+
+
+def part2(file_path: str) -> int:
+    return solve_equations(parse_input(file_path), operators=("+", "*", "||"))
+
+
 def main():
     import os
     # Determine the directory of the current script
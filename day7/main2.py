@@ -0,0 +1,189 @@
+import os
+from bisect import bisect_right
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from time import perf_counter
+from typing import Callable
+
+POWERS_OF_TEN = [10 ** k for k in range(1, 40)]
+ANY = object()  # returned by an inverse when every left operand works (e.g. x * 0 == 0)
+PART_ONE = ("+", "*")
+PART_TWO = ("+", "*", "||")
+MIN_PARALLEL_EQUATIONS = 2000  # below this the pool costs more than it saves
+CHUNKS_PER_WORKER = 16
+
+
+def parse_input(file_path: str) -> list[tuple[int, list[int]]]:
+    """
+    Parse the input file into a list of (target result, numbers) equations.
+    """
+    with open(file_path, "r") as file:
+        equations = [
+            (int(line.split(":")[0]), [int(num) for num in line.split(":")[1].split()])
+            for line in file if line.strip()
+        ]
+    return equations
+
+
+def power_of_ten(value: int) -> int:
+    """
+    Smallest power of ten above ``value``: what the left operand is shifted by when
+    ``value`` is concatenated to it. Values past the table fall back to counting digits.
+    """
+    index = bisect_right(POWERS_OF_TEN, value)
+    return POWERS_OF_TEN[index] if index < len(POWERS_OF_TEN) else 10 ** len(str(value))
+
+
+@dataclass(frozen=True)
+class Operator:
+    """
+    A binary operator, evaluated left to right.
+
+    Attributes:
+        symbol (str): Name used in operator lists, e.g. ``"+"``.
+        apply (callable): ``apply(left, right)`` -> result.
+        undo (callable): ``undo(result, right)`` -> the left operand that gives ``result``,
+            ``None`` if there is none, or ``ANY`` if every left operand does.
+    """
+    symbol: str
+    apply: Callable[[int, int], int]
+    undo: Callable[[int, int], object]
+
+
+OPERATORS: dict[str, Operator] = {}
+
+
+def register_operator(symbol: str, apply: Callable[[int, int], int], undo: Callable[[int, int], object]) -> Operator:
+    """
+    Make an operator available to ``evaluate``, ``is_solvable`` and ``solve_equations`` by symbol.
+    The built-in inverses assume every intermediate value is non-negative.
+    """
+    OPERATORS[symbol] = Operator(symbol, apply, undo)
+    return OPERATORS[symbol]
+
+
+def _undo_multiply(result: int, right: int):
+    if right == 0:
+        return ANY if result == 0 else None
+    return result // right if result % right == 0 else None
+
+
+def _undo_concat(result: int, right: int):
+    power = power_of_ten(right)
+    return result // power if result % power == right else None
+
+
+register_operator("+", lambda left, right: left + right,
+                  lambda result, right: result - right if result >= right else None)
+register_operator("*", lambda left, right: left * right, _undo_multiply)
+register_operator("||", lambda left, right: left * power_of_ten(right) + right, _undo_concat)
+
+
+def evaluate(numbers: list[int], symbols: tuple[str, ...]) -> int:
+    """
+    Evaluate the numbers with the given operators, left to right, in integers only.
+    """
+    result = numbers[0]
+    for symbol, value in zip(symbols, numbers[1:]):
+        result = OPERATORS[symbol].apply(result, value)
+    return result
+
+
+def is_solvable(target: int, numbers: list[int], operators: tuple = PART_ONE, last: int = None) -> bool:
+    """
+    Work backwards from the target, undoing the last operator first.
+
+    Every operator's inverse tells whether the last number could have been combined
+    that way, and with which left operand: subtract (never below zero), divide (only
+    if it divides evenly), strip the digits (only if the target ends with them). A
+    branch whose undo is impossible is dropped at once, so almost every line is decided
+    after a handful of steps instead of trying all k^(n-1) operator combinations.
+
+    Args:
+        target (int): Value the first ``last + 1`` numbers must produce.
+        numbers (list): Operands, all non-negative.
+        operators (tuple): Operator symbols or ``Operator`` objects to try.
+        last (int): Index of the last operand still in play (default: the last one).
+    """
+    if last is None:
+        last = len(numbers) - 1
+        operators = tuple(OPERATORS[op] if isinstance(op, str) else op for op in operators)
+    value = numbers[last]
+    if last == 0:
+        return target == value
+    for op in operators:
+        left = op.undo(target, value)
+        if left is ANY:
+            return True
+        if left is not None and is_solvable(left, numbers, operators, last - 1):
+            return True
+    return False
+
+
+def solve_equations(equations: list[tuple[int, list[int]]], operators: tuple = PART_ONE) -> int:
+    """
+    The sum of the target results of all equations that can be made true.
+    """
+    return sum(target for target, numbers in equations if is_solvable(target, numbers, operators))
+
+
+def solve_both(equations: list[tuple[int, list[int]]]) -> tuple[int, int]:
+    """
+    Both totals in one pass. A line solved with ``+``/``*`` counts for part two as well,
+    so the wider part-two search only runs for lines part one could not solve.
+    """
+    part_one = part_two = 0
+    for target, numbers in equations:
+        if is_solvable(target, numbers, PART_ONE):
+            part_one += target
+            part_two += target
+        elif is_solvable(target, numbers, PART_TWO):
+            part_two += target
+    return part_one, part_two
+
+
+def solve_parallel(equations: list[tuple[int, list[int]]], workers: int = None) -> tuple[int, int]:
+    """
+    ``solve_both`` spread over a process pool.
+
+    Equations are sorted by operand count, longest first, and cut into many small chunks.
+    The pool hands the next chunk to whichever worker is free, so the long lines start
+    early and the short ones fill the gaps at the end instead of one long line running
+    alone. Operators are looked up by symbol in each worker, so custom operators must be
+    registered at import time of this module to be seen there.
+    """
+    workers = workers or os.cpu_count() or 1
+    if workers == 1 or len(equations) < MIN_PARALLEL_EQUATIONS:
+        return solve_both(equations)
+    ordered = sorted(equations, key=lambda eq: len(eq[1]), reverse=True)
+    size = -(-len(ordered) // (workers * CHUNKS_PER_WORKER))
+    chunks = [ordered[i:i + size] for i in range(0, len(ordered), size)]
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        totals = list(pool.map(solve_both, chunks))
+    return sum(t[0] for t in totals), sum(t[1] for t in totals)
+
+
+def part1(file_path: str) -> int:
+    return solve_equations(parse_input(file_path), PART_ONE)
+
+
+def part2(file_path: str) -> int:
+    return solve_parallel(parse_input(file_path))[1]
+
+
+def main():
+    directory = os.path.dirname(os.path.abspath(__file__))
+    file_path = os.path.join(directory, 'input.txt')
+    equations = parse_input(file_path)
+
+    start = perf_counter()
+    part_one_result, part_two_result = solve_parallel(equations)
+    end = perf_counter()
+
+    print(f"Part One: {part_one_result}")
+    print(f"Part Two: {part_two_result}")
+    print(f"Elapsed Time (Both Parts): {end - start:0.4f}s")
+
+
+if __name__ == "__main__":
+    main()
@@ -32,7 +32,6 @@ def parse_grid(grid):
                 if cell not in antennas:
                     antennas[cell] = []
                 antennas[cell].append((x, y))
-    print(antennas)
     return antennas
 
 """
@@ -217,6 +216,12 @@ def count_antinodes_part2(data):
 
 
 
+def part1(file_path):
+    return count_antinodes(read_grid(file_path))
+
+def part2(file_path):
+    return count_antinodes_part2(read_grid(file_path))
+
 def main():
     import os
     # Determine the directory of the current script